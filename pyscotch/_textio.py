@@ -0,0 +1,85 @@
+"""
+Integer text I/O shared by the graph, mesh and mapping file formats.
+
+Pure NumPy — no Scotch — so Mapping, which is usable without the library,
+can write and parse the same formats as Graph and Mesh.
+"""
+
+import mmap
+import os
+
+import numpy as np
+
+# Buffer size for file I/O, both Python-side (mapping files) and for the C
+# streams pyscotch.graph.c_fopen hands to Scotch. The defaults
+# (io.DEFAULT_BUFFER_SIZE, 8 KiB, and one filesystem block for stdio) turn a
+# multi-MB graph or mapping into thousands of read/write syscalls; 1 MiB
+# keeps it to a handful.
+_IO_BUFFER_SIZE = 1 << 20
+
+# Rows formatted per string operation by _write_int_rows
+_TEXT_ROWS_PER_CHUNK = 1 << 16
+
+# Slice of a memory-mapped text file tokenized per NumPy call by
+# _read_int_tokens: bounds the transient bytes copy for multi-GB files.
+_PARSE_CHUNK_SIZE = 64 << 20
+
+
+def _write_int_rows(f, columns) -> None:
+    """
+    Write integer columns to text file ``f`` as tab-separated rows.
+
+    Each chunk of rows is rendered by a single ``%`` format over a flat list
+    of Python ints, which is several times faster than np.savetxt (that
+    formats and writes row by row in Python).
+
+    Args:
+        f: Text file opened for writing
+        columns: Sequence of equal-length 1-D integer arrays
+    """
+    table = np.column_stack([np.asarray(c) for c in columns])
+    row_fmt = "\t".join(["%d"] * table.shape[1]) + "\n"
+    for start in range(0, len(table), _TEXT_ROWS_PER_CHUNK):
+        chunk = table[start : start + _TEXT_ROWS_PER_CHUNK]
+        f.write((row_fmt * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+
+def _read_int_tokens(filename) -> np.ndarray:
+    """
+    Read all whitespace-separated integers of a text file as an int64 array.
+
+    The file is memory-mapped and tokenized by NumPy in slices of
+    _PARSE_CHUNK_SIZE bytes, each cut at a whitespace boundary, so the only
+    Python-side copy is one slice at a time (no whole-file str).
+
+    A malformed token raises ValueError naming the file. (NumPy 2 raises on
+    it; older NumPy instead stops parsing there with a DeprecationWarning,
+    and callers' token-count checks catch the short result.)
+
+    Raises:
+        ValueError: If the file holds a token that is not an integer
+    """
+    with open(filename, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return np.empty(0, dtype=np.int64)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            if hasattr(m, "madvise"):
+                m.madvise(mmap.MADV_SEQUENTIAL)
+            chunks = []
+            start = 0
+            while start < size:
+                end = min(start + _PARSE_CHUNK_SIZE, size)
+                while end < size and m[end : end + 1] not in b" \t\r\n":
+                    end += 1  # do not split a token across slices
+                text = m[start:end]
+                start = end
+                if text.isspace():
+                    continue  # NumPy would parse a blank slice as [0]
+                try:
+                    chunks.append(np.fromstring(text, dtype=np.int64, sep=" "))
+                except ValueError:
+                    raise ValueError(f"{filename}: malformed integer data") from None
+    if not chunks:
+        return np.empty(0, dtype=np.int64)
+    return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
@@ -17,8 +17,14 @@ class Architecture:
     decomposition onto which a graph will be mapped.
     """
 
+    # Fixed attribute set, as on Graph: partition_batch and the mapping
+    # fallback create one per call
+    __slots__ = ("_arch", "_initialized", "__weakref__")
+
     def __init__(self):
         """Initialize an architecture."""
+        # Set first so close() can read it directly even if init fails below
+        self._initialized = False
         self._arch = lib.SCOTCH_Arch()
         ret = lib.SCOTCH_archInit(byref(self._arch))
         if ret != 0:
@@ -36,7 +42,7 @@ class Architecture:
     @scotch_binding("SCOTCH_archExit", "void SCOTCH_archExit(SCOTCH_Arch *)")
     def close(self):
         """Release architecture resources. Called automatically when used as a context manager."""
-        if getattr(self, "_initialized", False):
+        if self._initialized:
             lib.SCOTCH_archExit(byref(self._arch))
             self._initialized = False
 
@@ -9,7 +9,7 @@ import numpy as np
 from contextlib import contextmanager
 from pathlib import Path
 import ctypes
-from ctypes import byref, POINTER, c_int
+from ctypes import byref, c_int
 from typing import Optional, Tuple
 
 from pyscotch.libscotch import (
@@ -29,6 +29,9 @@ from pyscotch.api_decorators import scotch_binding, highlevel_api, internal_api
 from pyscotch.mpi import mpi
 from pyscotch.graph import c_fopen
 
+# NumPy dtype of SCOTCH_Num; fixed once the Scotch library is loaded
+_SCOTCH_DTYPE = lib.get_scotch_dtype()
+
 
 def _resolve_comm(comm):
     """Resolve a Dgraph ``comm`` argument to what Scotch and Python each need.
@@ -380,16 +383,16 @@ class Dgraph:
         vertlocnbr = lib.SCOTCH_Num() if want_vertlocnbr else None
         vertlocmax = lib.SCOTCH_Num() if want_vertlocmax else None
         vertgstnbr = lib.SCOTCH_Num() if want_vertgstnbr else None
-        vertloctab = POINTER(lib.SCOTCH_Num)() if want_vertloctab else None
-        vendloctab = POINTER(lib.SCOTCH_Num)() if want_vendloctab else None
-        veloloctab = POINTER(lib.SCOTCH_Num)() if want_veloloctab else None
-        vlblloctab = POINTER(lib.SCOTCH_Num)() if want_vlblloctab else None
+        vertloctab = lib.SCOTCH_NumPtr() if want_vertloctab else None
+        vendloctab = lib.SCOTCH_NumPtr() if want_vendloctab else None
+        veloloctab = lib.SCOTCH_NumPtr() if want_veloloctab else None
+        vlblloctab = lib.SCOTCH_NumPtr() if want_vlblloctab else None
         edgeglbnbr = lib.SCOTCH_Num() if want_edgeglbnbr else None
         edgelocnbr = lib.SCOTCH_Num() if want_edgelocnbr else None
         edgelocsiz = lib.SCOTCH_Num() if want_edgelocsiz else None
-        edgeloctab = POINTER(lib.SCOTCH_Num)() if want_edgeloctab else None
-        edgegsttab = POINTER(lib.SCOTCH_Num)() if want_edgegsttab else None
-        edloloctab = POINTER(lib.SCOTCH_Num)() if want_edloloctab else None
+        edgeloctab = lib.SCOTCH_NumPtr() if want_edgeloctab else None
+        edgegsttab = lib.SCOTCH_NumPtr() if want_edgegsttab else None
+        edloloctab = lib.SCOTCH_NumPtr() if want_edloloctab else None
         # MPI_Comm is written here by value: 8-byte pointer under OpenMPI,
         # 4-byte int under MPICH — c_void_p is large enough for both
         commptr = ctypes.c_void_p() if want_commptr else None
@@ -523,7 +526,7 @@ class Dgraph:
         coarvertlocmax = self.coarsen_vert_loc_max(foldval)
 
         # Allocate multinode array
-        multloctab = np.zeros(coarvertlocmax * 2, dtype=lib.get_scotch_dtype())
+        multloctab = np.zeros(coarvertlocmax * 2, dtype=_SCOTCH_DTYPE)
 
         # Create coarse graph on the same communicator (pass the mpi4py object
         # through when we have one, so the child keeps rank queries mpi4py-based)
@@ -538,7 +541,7 @@ class Dgraph:
             float(coarrat),
             lib.SCOTCH_Num(foldval),
             byref(coarse_graph._dgraph),
-            multloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
+            multloctab.ctypes.data_as(lib.SCOTCH_NumPtr),
         )
 
         if ret == 0:
@@ -630,9 +633,9 @@ class Dgraph:
         ret = lib.SCOTCH_dgraphGrow(
             byref(self._dgraph),
             lib.SCOTCH_Num(seedlocnbr),
-            seedloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
+            seedloctab.ctypes.data_as(lib.SCOTCH_NumPtr),
             lib.SCOTCH_Num(distmax),
-            partgsttab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
+            partgsttab.ctypes.data_as(lib.SCOTCH_NumPtr),
         )
         if ret != 0:
             raise lib.scotch_error("Failed to grow graph", ret)
@@ -678,7 +681,7 @@ class Dgraph:
         ret = lib.SCOTCH_dgraphBand(
             byref(self._dgraph),
             lib.SCOTCH_Num(fronlocnbr),
-            fronloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
+            fronloctab.ctypes.data_as(lib.SCOTCH_NumPtr),
             lib.SCOTCH_Num(distmax),
             byref(bandgrafdat._dgraph),
         )
@@ -731,12 +734,12 @@ class Dgraph:
         """
         # Handle None permgsttab by passing NULL pointer
         permgsttab_ptr = (
-            None if permgsttab is None else permgsttab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+            None if permgsttab is None else permgsttab.ctypes.data_as(lib.SCOTCH_NumPtr)
         )
 
         ret = lib.SCOTCH_dgraphRedist(
             byref(self._dgraph),
-            partloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
+            partloctab.ctypes.data_as(lib.SCOTCH_NumPtr),
             permgsttab_ptr,
             lib.SCOTCH_Num(vertlocdlt),
             lib.SCOTCH_Num(edgelocdlt),
@@ -787,7 +790,7 @@ class Dgraph:
         """
         ret = lib.SCOTCH_dgraphInducePart(
             byref(self._dgraph),
-            orgpartloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
+            orgpartloctab.ctypes.data_as(lib.SCOTCH_NumPtr),
             lib.SCOTCH_Num(partval),
             lib.SCOTCH_Num(indvertlocnbr),
             byref(indgrafdat._dgraph),
@@ -944,7 +947,10 @@ class Dgraph:
             >>> cgraph = Graph() if rank == 0 else None
             >>> dgraph.gather(cgraph)
         """
-        graph_ptr = byref(graph._graph) if graph is not None else None
+        graph_ptr = None
+        if graph is not None:
+            graph._invalidate_caches()
+            graph_ptr = byref(graph._graph)
         ret = lib.SCOTCH_dgraphGather(byref(self._dgraph), graph_ptr)
         if ret != 0:
             raise lib.scotch_error("Failed to gather distributed graph", ret)
@@ -1059,13 +1065,13 @@ class Dgraph:
         if strategy is None:
             strategy = Strategy()
 
-        partloctab = np.zeros(self._vertlocnbr(), dtype=lib.get_scotch_dtype())
+        partloctab = np.zeros(self._vertlocnbr(), dtype=_SCOTCH_DTYPE)
 
         ret = lib.SCOTCH_dgraphPart(
             byref(self._dgraph),
             lib.SCOTCH_Num(nparts),
             byref(strategy._strat),
-            partloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
+            partloctab.ctypes.data_as(lib.SCOTCH_NumPtr),
         )
         if ret != 0:
             raise lib.scotch_error(
@@ -1100,13 +1106,13 @@ class Dgraph:
         if strategy is None:
             strategy = Strategy()
 
-        partloctab = np.zeros(self._vertlocnbr(), dtype=lib.get_scotch_dtype())
+        partloctab = np.zeros(self._vertlocnbr(), dtype=_SCOTCH_DTYPE)
 
         ret = lib.SCOTCH_dgraphMap(
             byref(self._dgraph),
             byref(arch._arch),
             byref(strategy._strat),
-            partloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
+            partloctab.ctypes.data_as(lib.SCOTCH_NumPtr),
         )
         if ret != 0:
             raise lib.scotch_error("Failed to map distributed graph", ret)
@@ -1139,8 +1145,8 @@ class Dgraph:
         if strategy is None:
             strategy = Strategy()
 
-        partloctab = np.zeros(self._vertlocnbr(), dtype=lib.get_scotch_dtype())
-        partloctab_c = partloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        partloctab = np.zeros(self._vertlocnbr(), dtype=_SCOTCH_DTYPE)
+        partloctab_c = partloctab.ctypes.data_as(lib.SCOTCH_NumPtr)
 
         with self._scotch_dmapping(arch, partloctab_c) as dmapdat:
             ret = lib.SCOTCH_dgraphMapCompute(
@@ -1175,8 +1181,8 @@ class Dgraph:
         if strategy is None:
             strategy = Strategy()
 
-        partloctab = np.zeros(self._vertlocnbr(), dtype=lib.get_scotch_dtype())
-        partloctab_c = partloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        partloctab = np.zeros(self._vertlocnbr(), dtype=_SCOTCH_DTYPE)
+        partloctab_c = partloctab.ctypes.data_as(lib.SCOTCH_NumPtr)
 
         with self._scotch_dmapping(arch, partloctab_c) as dmapdat:
             ret = lib.SCOTCH_dgraphMapCompute(
@@ -1214,8 +1220,8 @@ class Dgraph:
         if strategy is None:
             strategy = Strategy()
 
-        partloctab = np.zeros(self._vertlocnbr(), dtype=lib.get_scotch_dtype())
-        partloctab_c = partloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        partloctab = np.zeros(self._vertlocnbr(), dtype=_SCOTCH_DTYPE)
+        partloctab_c = partloctab.ctypes.data_as(lib.SCOTCH_NumPtr)
 
         with self._scotch_dmapping(arch, partloctab_c) as dmapdat:
             ret = lib.SCOTCH_dgraphMapCompute(
@@ -1355,11 +1361,11 @@ class Dgraph:
         Raises:
             RuntimeError: If retrieving the permutation fails
         """
-        permloctab = np.zeros(self._vertlocnbr(), dtype=lib.get_scotch_dtype())
+        permloctab = np.zeros(self._vertlocnbr(), dtype=_SCOTCH_DTYPE)
         ret = lib.SCOTCH_dgraphOrderPerm(
             byref(self._dgraph),
             byref(dordering),
-            permloctab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
+            permloctab.ctypes.data_as(lib.SCOTCH_NumPtr),
         )
         if ret != 0:
             raise lib.scotch_error("Failed to get distributed ordering permutation", ret)
@@ -1401,13 +1407,13 @@ class Dgraph:
             RuntimeError: If the tree structure cannot be retrieved
         """
         cblkglbnbr = self.order_cblk_dist(dordering)
-        treeglbtab = np.zeros(cblkglbnbr, dtype=lib.get_scotch_dtype())
-        sizeglbtab = np.zeros(cblkglbnbr, dtype=lib.get_scotch_dtype())
+        treeglbtab = np.zeros(cblkglbnbr, dtype=_SCOTCH_DTYPE)
+        sizeglbtab = np.zeros(cblkglbnbr, dtype=_SCOTCH_DTYPE)
         ret = lib.SCOTCH_dgraphOrderTreeDist(
             byref(self._dgraph),
             byref(dordering),
-            treeglbtab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
-            sizeglbtab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
+            treeglbtab.ctypes.data_as(lib.SCOTCH_NumPtr),
+            sizeglbtab.ctypes.data_as(lib.SCOTCH_NumPtr),
         )
         if ret != 0:
             raise lib.scotch_error("Failed to get distributed elimination tree", ret)
@@ -1485,12 +1491,11 @@ class Dgraph:
             # order_gather), so silent conversion copies would lose results.
             if array is None:
                 return None
-            if array.dtype != lib.get_scotch_dtype() or not array.flags["C_CONTIGUOUS"]:
+            if array.dtype != _SCOTCH_DTYPE or not array.flags["C_CONTIGUOUS"]:
                 raise ValueError(
-                    f"{name} must be a C-contiguous array of dtype "
-                    f"{lib.get_scotch_dtype().__name__}"
+                    f"{name} must be a C-contiguous array of dtype {_SCOTCH_DTYPE.__name__}"
                 )
-            return array.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+            return array.ctypes.data_as(lib.SCOTCH_NumPtr)
 
         cordering = lib.SCOTCH_Ordering()
         cblkptr = lib.SCOTCH_Num()
@@ -4,40 +4,78 @@ High-level Graph class for PT-Scotch.
 
 import numpy as np
 import ctypes
+import mmap
 import os
-from contextlib import contextmanager
-from ctypes import byref, c_long, POINTER, cast, c_void_p, CDLL
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from ctypes import addressof, byref, POINTER, c_void_p, CDLL
 from pathlib import Path
-from typing import Optional, Union, List, Tuple
+from typing import Dict, Optional, Union, List, Tuple
 
 from .api_decorators import scotch_binding, highlevel_api, internal_api
 from . import libscotch as lib
-
-
-@contextmanager
-def c_fopen(filename: str, mode: str = "r"):
+from .arch import Architecture
+from .strategy import Strategy
+from ._textio import _IO_BUFFER_SIZE, _read_int_tokens, _write_int_rows
+
+# NumPy dtype of SCOTCH_Num; fixed once the Scotch library is loaded
+_SCOTCH_DTYPE = lib.get_scotch_dtype()
+
+# SCOTCH_graphPart is the one-call equivalent of mapping onto a complete-graph
+# architecture; partition() falls back to the Init/Compute/Exit sequence when
+# the loaded library lacks it
+_HAVE_GRAPH_PART = lib._has_func("SCOTCH_graphPart")
+
+# Arrays at least this large are huge-page aligned and advised for
+# transparent huge pages by _aligned_empty (Linux MADV_HUGEPAGE)
+_HUGE_PAGE_SIZE = 2 << 20
+_MADV_HUGEPAGE = 14
+_MADVISE = None
+
+# Binary graph files (Graph.save_binary / Graph.load_binary): a header of
+# _BINARY_HEADER_LEN native int64 words, then verttab, edgetab and the
+# optional velotab/edlotab as raw SCOTCH_Num arrays. The 64-byte header keeps
+# the arrays cache-line aligned when memory-mapped.
+_BINARY_MAGIC = int.from_bytes(b"PYSCOTCH", "little")
+_BINARY_VERSION = 1
+_BINARY_HEADER_LEN = 8
+_BINARY_HAS_VELO = 1
+_BINARY_HAS_EDLO = 2
+# Only the u < v half of each symmetric adjacency is stored (save_binary
+# half_edges=True); such files are written as version 2 so that readers
+# predating the flag reject them instead of building a one-way graph
+_BINARY_HALF_EDGES = 4
+_BINARY_HALF_VERSION = 2
+
+
+# (fopen, fclose, get_errno, setvbuf) resolved on first use by _file_functions()
+_FILE_FUNCTIONS = None
+
+# Encoded fopen modes for the common cases
+_FOPEN_MODES = {mode: mode.encode("ascii") for mode in ("r", "w", "a", "rb", "wb", "ab")}
+
+
+def _file_functions():
     """
-    Context manager for C FILE* pointers using our compatibility layer.
-
-    Uses libpyscotch_compat.so which is compiled with the SAME toolchain
-    as Scotch, guaranteeing perfect ABI compatibility (no struct layout
-    mismatches, LFS issues, etc.)
+    Return the (fopen, fclose, get_errno, setvbuf) callables c_fopen uses.
 
-    Args:
-        filename: Path to file
-        mode: File mode ("r", "w", "rb", "wb", etc.)
+    setvbuf takes (FILE*, size) and is None when an older compat library
+    does not provide it.
 
-    Yields:
-        C FILE* pointer (as ctypes.c_void_p)
+    The library lookup and prototype setup happen once per process; the
+    result is cached in _FILE_FUNCTIONS. Resolution is deferred to the first
+    file operation so that a missing compat library only fails file I/O, not
+    the import of pyscotch.
 
     Raises:
-        IOError: If file cannot be opened
         RuntimeError: If compat library cannot be loaded
-
-    Example:
-        with c_fopen("graph.grf", "r") as file_ptr:
-            lib.SCOTCH_graphLoad(byref(graph._graph), file_ptr, -1, 0)
     """
+    global _FILE_FUNCTIONS
+    if _FILE_FUNCTIONS is not None:
+        return _FILE_FUNCTIONS
+
     # Find the compat library in the same directory as Scotch libs.
     # lib._lib_dir is None when the system-installed Scotch is loaded: system
     # Scotch and CPython link the same platform libc, so plain fopen/fclose
@@ -52,29 +90,81 @@ def c_fopen(filename: str, mode: str = "r"):
             )
 
         # Load our compat library (compiled with same toolchain as Scotch)
-        compat = CDLL(compat_path)
+        compat = lib._get_cdll(compat_path)
         c_fopen_func = compat.pyscotch_fopen
         c_fclose_func = compat.pyscotch_fclose
         get_errno = compat.pyscotch_get_errno
         get_errno.argtypes = []
         get_errno.restype = ctypes.c_int
+        try:
+            c_setvbuf_func = compat.pyscotch_setvbuf
+            c_setvbuf_func.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+            c_setvbuf_func.restype = ctypes.c_int
+        except AttributeError:
+            c_setvbuf_func = None  # older shim: keep stdio's default buffering
     else:
         libc = CDLL(None, use_errno=True)
         c_fopen_func = libc.fopen
         c_fclose_func = libc.fclose
         get_errno = ctypes.get_errno
+        libc_setvbuf = libc.setvbuf
+        libc_setvbuf.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_size_t]
+        libc_setvbuf.restype = ctypes.c_int
+
+        def c_setvbuf_func(stream, size):
+            return libc_setvbuf(stream, None, 0, size)  # 0 == _IOFBF (glibc, musl, BSD)
 
     c_fopen_func.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
     c_fopen_func.restype = ctypes.c_void_p
     c_fclose_func.argtypes = [ctypes.c_void_p]
     c_fclose_func.restype = ctypes.c_int
 
+    _FILE_FUNCTIONS = (c_fopen_func, c_fclose_func, get_errno, c_setvbuf_func)
+    return _FILE_FUNCTIONS
+
+
+@contextmanager
+def c_fopen(filename: Union[str, bytes, os.PathLike], mode: Union[str, bytes] = "r"):
+    """
+    Context manager for C FILE* pointers using our compatibility layer.
+
+    Uses libpyscotch_compat.so which is compiled with the SAME toolchain
+    as Scotch, guaranteeing perfect ABI compatibility (no struct layout
+    mismatches, LFS issues, etc.)
+
+    Args:
+        filename: Path to file (str, bytes or os.PathLike)
+        mode: File mode ("r", "w", "rb", "wb", etc.), as str or bytes
+
+    Yields:
+        C FILE* pointer (as ctypes.c_void_p)
+
+    Raises:
+        IOError: If file cannot be opened (FileNotFoundError, PermissionError...
+            according to errno)
+        RuntimeError: If compat library cannot be loaded
+
+    Example:
+        with c_fopen("graph.grf", "r") as file_ptr:
+            lib.SCOTCH_graphLoad(byref(graph._graph), file_ptr, -1, 0)
+    """
+    c_fopen_func, c_fclose_func, get_errno, c_setvbuf_func = _file_functions()
+
     # Open the file
-    file_ptr = c_fopen_func(str(filename).encode(), mode.encode())
+    # os.fsencode applies the filesystem encoding (with surrogateescape, so
+    # undecodable names round-trip) and passes bytes paths through as-is
+    mode_b = _FOPEN_MODES.get(mode) or (mode if isinstance(mode, bytes) else mode.encode("ascii"))
+    file_ptr = c_fopen_func(os.fsencode(filename), mode_b)
 
     if not file_ptr:
+        # OSError(errno, ...) instantiates the matching subclass, so a
+        # missing file raises FileNotFoundError like Python's open() does
         errno_val = get_errno()
-        raise IOError(f"Failed to open file '{filename}' with mode '{mode}' (errno: {errno_val})")
+        raise OSError(errno_val, f"Failed to open file with mode '{mode}'", filename)
+
+    # Large stdio buffer for Scotch's fscanf/fprintf; must precede any I/O
+    if c_setvbuf_func is not None:
+        c_setvbuf_func(file_ptr, _IO_BUFFER_SIZE)
 
     try:
         # Yield the FILE* pointer to the caller
@@ -85,6 +175,184 @@ def c_fopen(filename: str, mode: str = "r"):
             c_fclose_func(file_ptr)
 
 
+def _madvise_function():
+    """
+    Return libc's madvise with its prototype set, or None where unavailable.
+
+    Resolved once per process and cached in _MADVISE (False: not available).
+    """
+    global _MADVISE
+    if _MADVISE is None:
+        _MADVISE = False
+        if sys.platform.startswith("linux"):
+            try:
+                madvise = CDLL(None, use_errno=True).madvise
+                madvise.argtypes = [c_void_p, ctypes.c_size_t, ctypes.c_int]
+                madvise.restype = ctypes.c_int
+                _MADVISE = madvise
+            except (OSError, AttributeError):
+                pass
+    return _MADVISE or None
+
+
+def _aligned_empty(size: int, dtype, align: int = 64) -> np.ndarray:
+    """
+    Allocate an uninitialized 1-D array whose data starts on an ``align``-byte
+    boundary.
+
+    NumPy only guarantees 16-byte alignment; Scotch's CSR arrays are
+    allocated on cache-line boundaries so its compiled loops can use aligned
+    wide loads. The returned array is a view whose ``base`` keeps the
+    over-allocated buffer alive.
+
+    Arrays of at least _HUGE_PAGE_SIZE bytes are instead aligned on a huge
+    page and, on Linux, advised for transparent huge pages: Scotch walks the
+    CSR arrays of large graphs in random order, where 4 KiB pages make TLB
+    misses a measurable part of the run time. The advice is best effort.
+    """
+    dtype = np.dtype(dtype)
+    nbytes = size * dtype.itemsize
+    huge = nbytes >= _HUGE_PAGE_SIZE
+    if huge:
+        align = _HUGE_PAGE_SIZE
+    buf = np.empty(nbytes + align, dtype=np.uint8)
+    offset = -buf.ctypes.data % align
+    if huge:
+        madvise = _madvise_function()
+        if madvise is not None:
+            # Whole huge pages inside the array only; failure (THP disabled,
+            # old kernel) leaves ordinary pages, which is harmless.
+            madvise(buf.ctypes.data + offset, nbytes & -_HUGE_PAGE_SIZE, _MADV_HUGEPAGE)
+    return buf[offset : offset + nbytes].view(dtype)
+
+
+def _aligned_copy(values, dtype) -> np.ndarray:
+    """Copy ``values`` into a new 64-byte aligned array of ``dtype``."""
+    values = np.asarray(values)
+    out = _aligned_empty(len(values), dtype)
+    out[...] = values
+    return out
+
+
+def _expand_half_csr(half_verttab, half_edgetab, half_edlotab):
+    """
+    Rebuild the full symmetric CSR arrays from their ``u < v`` half.
+
+    Each stored arc u->v also yields v->u. Within a vertex the reverse arcs
+    (to lower-numbered neighbours) come first, so a graph whose adjacency
+    lists were sorted comes back sorted. Returns aligned
+    (verttab, edgetab, edlotab); edlotab is None when half_edlotab is.
+    """
+    scotch_dtype = _SCOTCH_DTYPE
+    vertnbr = len(half_verttab) - 1
+    half_src = np.repeat(np.arange(vertnbr, dtype=scotch_dtype), np.diff(half_verttab))
+    src = np.concatenate((half_edgetab, half_src))
+    dst = np.concatenate((half_src, half_edgetab))
+
+    arc_order = _bucket_order(src, vertnbr)
+    edgetab = _aligned_empty(len(dst), scotch_dtype)
+    np.take(dst, arc_order, out=edgetab)
+    verttab = _aligned_empty(vertnbr + 1, scotch_dtype)
+    verttab[0] = 0
+    np.cumsum(np.bincount(src, minlength=vertnbr), out=verttab[1:])
+
+    edlotab = None
+    if half_edlotab is not None:
+        edlotab = _aligned_empty(len(dst), scotch_dtype)
+        np.take(np.concatenate((half_edlotab, half_edlotab)), arc_order, out=edlotab)
+    return verttab, edgetab, edlotab
+
+
+def _bucket_order(keys: np.ndarray, num_buckets: int) -> np.ndarray:
+    """
+    Return the stable sorting permutation of ``keys`` (vertex indices in
+    ``[0, num_buckets)``), in linear time.
+
+    NumPy's stable argsort is a radix sort for 16-bit keys but a merge sort
+    for wider ones. The keys are therefore sorted as one or two 16-bit
+    digits (an LSD radix sort), which is several times faster than
+    argsort on the full-width keys for large edge lists.
+    """
+    if num_buckets <= 1 << 16:
+        return np.argsort(keys.astype(np.uint16), kind="stable")
+    if num_buckets <= 1 << 32:
+        order = np.argsort((keys & 0xFFFF).astype(np.uint16), kind="stable")
+        high = (keys[order] >> 16).astype(np.uint16)
+        return order[np.argsort(high, kind="stable")]
+    return np.argsort(keys, kind="stable")
+
+
+# Zero-length SCOTCH_Num array type: instances made with from_address() are
+# accepted wherever the bindings declare POINTER(SCOTCH_Num)
+_SCOTCH_NUM_ARRAY = lib.SCOTCH_Num * 0
+
+
+def _num_ptr(arr: np.ndarray):
+    """
+    Return a SCOTCH_Num* argument for the data of ``arr``.
+
+    About twice as cheap as ``arr.ctypes.data_as(POINTER(SCOTCH_Num))``, which
+    builds a helper object and a cast per call. The caller must keep ``arr``
+    alive, C-contiguous and of the Scotch dtype while Scotch uses the pointer.
+    """
+    return _SCOTCH_NUM_ARRAY.from_address(arr.ctypes.data)
+
+
+def _as_scotch_array(values, dtype) -> np.ndarray:
+    """
+    Return ``values`` itself when it is already a contiguous, aligned, writable
+    array of ``dtype``; otherwise a 64-byte aligned copy converted to ``dtype``.
+
+    Read-only inputs (bytes, read-only memory maps...) are always copied:
+    Scotch writes into the arrays it is given, e.g. in SCOTCH_graphBase.
+    """
+    values = np.asarray(values)
+    flags = values.flags
+    if values.dtype == dtype and flags.c_contiguous and flags.aligned and flags.writeable:
+        return values
+    return _aligned_copy(values, dtype)
+
+
+# Untyped byte containers: their contents are taken as raw native SCOTCH_Num values
+_RAW_BYTE_TYPES = (bytes, bytearray, mmap.mmap)
+
+
+def _is_raw_bytes(values) -> bool:
+    """
+    Tell whether ``values`` is an untyped byte buffer: a bytes, bytearray or
+    mmap object, a memoryview of one, or a view explicitly cast to "B" from a
+    wider item type (``memoryview(arr).cast("B")``).
+    """
+    if isinstance(values, _RAW_BYTE_TYPES):
+        return True
+    if isinstance(values, memoryview) and values.format == "B":
+        if isinstance(values.obj, _RAW_BYTE_TYPES):
+            return True
+        return memoryview(values.obj).itemsize != 1
+    return False
+
+
+def _from_buffer(values):
+    """
+    View a buffer-protocol object (memoryview, array.array, bytes, mmap...)
+    as a NumPy array without copying; other inputs are returned unchanged.
+
+    Untyped byte buffers (see _is_raw_bytes) are taken to hold raw native
+    SCOTCH_Num values, e.g. a slice of a binary CSR file. Every other buffer,
+    including 1-byte typed ones such as ``array.array("b")`` or a view of a
+    uint8 array, keeps its own item format and is converted like any array.
+    """
+    if values is None or isinstance(values, np.ndarray):
+        return values
+    if _is_raw_bytes(values):
+        return np.frombuffer(values, dtype=_SCOTCH_DTYPE)
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return values  # lists, tuples, ...
+    return np.asarray(view)
+
+
 def _coerce_edge_weights(values, what: str = "edge weights") -> Optional[np.ndarray]:
     """
     Validate edge weight values and convert them to a Scotch edge load array.
@@ -133,11 +401,9 @@ def _coerce_edge_weights(values, what: str = "edge weights") -> Optional[np.ndar
             "Note that explicitly stored zeros count as edges; if zero means 'no edge', "
             "remove those entries first (e.g. matrix.eliminate_zeros())"
         )
-    out = arr.astype(lib.get_scotch_dtype())
+    out = arr.astype(_SCOTCH_DTYPE)
     if not np.array_equal(out, arr):
-        raise ValueError(
-            f"{what} do not fit in the Scotch integer type ({lib.get_scotch_dtype().__name__})"
-        )
+        raise ValueError(f"{what} do not fit in the Scotch integer type ({_SCOTCH_DTYPE.__name__})")
     if np.all(out == 1):
         return None
     return out
@@ -184,10 +450,35 @@ class Graph:
     - Map graphs to architectures
     """
 
+    # Fixed attribute set: smaller instances and faster attribute access for
+    # workloads creating many short-lived subgraphs (induce_parts, coarsen)
+    __slots__ = (
+        "_graph",
+        "_graph_addr",
+        "_initialized",
+        "_verttab",
+        "_vendtab",
+        "_vlbltab",
+        "_edgetab",
+        "_velotab",
+        "_edlotab",
+        "_scratch",
+        "_size_cache",
+        "__weakref__",
+    )
+
     def __init__(self):
         """Initialize an empty graph."""
+        # Set first so close() can read it directly even if init fails below
+        self._initialized = False
         self._graph = lib.SCOTCH_Graph()
-        ret = lib.SCOTCH_graphInit(byref(self._graph))
+        # Stable for the life of the instance; passed to lib.raw_function
+        # entry points instead of marshalling a pointer per call. The regular
+        # bindings get self._graph itself: their POINTER(SCOTCH_Graph)
+        # argtypes take the structure's address in C, about 3x cheaper than
+        # building a byref() object in Python first.
+        self._graph_addr = addressof(self._graph)
+        ret = lib.raw_function("SCOTCH_graphInit")(self._graph_addr)
         if ret != 0:
             raise lib.scotch_error("Failed to initialize graph", ret)
 
@@ -195,9 +486,14 @@ class Graph:
         # Keep references to arrays to prevent garbage collection
         self._verttab = None
         self._vendtab = None  # Added vendtab reference
+        self._vlbltab = None
         self._edgetab = None
         self._velotab = None
         self._edlotab = None
+        # Output buffers reused by partition(copy=False) / order(copy=False)
+        self._scratch = {}
+        # Result of size(), valid until the graph is loaded or built again
+        self._size_cache = None
 
     def __enter__(self):
         return self
@@ -209,10 +505,28 @@ class Graph:
     @scotch_binding("SCOTCH_graphExit", "void SCOTCH_graphExit(SCOTCH_Graph *)")
     def close(self):
         """Release graph resources. Called automatically when used as a context manager."""
-        if getattr(self, "_initialized", False):
-            lib.SCOTCH_graphExit(byref(self._graph))
+        if self._initialized:
+            lib.raw_function("SCOTCH_graphExit")(self._graph_addr)
             self._initialized = False
 
+    @scotch_binding("SCOTCH_graphFree", "void SCOTCH_graphFree(SCOTCH_Graph *)")
+    def free(self) -> None:
+        """
+        Free the graph contents while keeping the structure initialized.
+
+        Unlike close(), the Graph remains usable afterwards, like a freshly
+        initialized one. build() and load() do this implicitly, so a single
+        Graph can be rebuilt repeatedly without an Exit/Init cycle.
+        """
+        lib.raw_function("SCOTCH_graphFree")(self._graph_addr)
+        self._invalidate_caches()
+        self._verttab = None
+        self._vendtab = None
+        self._vlbltab = None
+        self._edgetab = None
+        self._velotab = None
+        self._edlotab = None
+
     @scotch_binding(
         "SCOTCH_graphLoad", "int SCOTCH_graphLoad(SCOTCH_Graph *, FILE *, SCOTCH_Num, SCOTCH_Num)"
     )
@@ -242,9 +556,8 @@ class Graph:
 
         # Use our compat layer - guarantees ABI compatibility with Scotch
         with c_fopen(str(filename), "r") as file_ptr:
-            ret = lib.SCOTCH_graphLoad(
-                byref(self._graph), file_ptr, lib.SCOTCH_Num(baseval), 0
-            )
+            self.free()
+            ret = lib.SCOTCH_graphLoad(self._graph, file_ptr, int(baseval), 0)
 
             if ret != 0:
                 raise lib.scotch_error(f"Failed to load graph from {filename}", ret)
@@ -267,11 +580,251 @@ class Graph:
 
         # Use our compat layer - guarantees ABI compatibility with Scotch
         with c_fopen(str(filename), "w") as file_ptr:
-            ret = lib.SCOTCH_graphSave(byref(self._graph), file_ptr)
+            ret = lib.SCOTCH_graphSave(self._graph, file_ptr)
 
             if ret != 0:
                 raise lib.scotch_error(f"Failed to save graph to {filename}", ret)
 
+    @staticmethod
+    @highlevel_api(scotch_functions=["SCOTCH_graphInit", "SCOTCH_graphBuild"])
+    def load_ascii(filename: Union[str, Path], baseval: int = 0) -> "Graph":
+        """
+        Load a Scotch .grf file by parsing it with NumPy instead of SCOTCH_graphLoad.
+
+        The file is memory-mapped and tokenized by NumPy in large slices, and
+        the arcs are gathered with vectorized indexing. Locating each vertex's
+        header is inherently sequential (its offset depends on the previous
+        degree), so that walk remains a Python loop over the vertices: the
+        cost is O(E) in NumPy plus O(V) in Python. Vertex labels, when
+        present, are used to resolve arc ends and are not kept on the graph.
+
+        Args:
+            filename: Path to the graph file (.grf format)
+            baseval: Same semantics as load(): 0 or 1 rebases the graph,
+                -1 keeps the file's own base.
+
+        Returns:
+            New Graph instance
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a well-formed Scotch graph
+            RuntimeError: If building fails
+        """
+        filename = Path(filename)
+        if not filename.exists():
+            raise FileNotFoundError(f"Graph file not found: {filename}")
+        if baseval not in (-1, 0, 1):
+            raise ValueError(f"baseval must be -1, 0 or 1, got {baseval}")
+
+        tokens = _read_int_tokens(filename)
+
+        if len(tokens) < 5 or tokens[0] != 0:
+            raise ValueError(f"{filename} is not a Scotch graph file (version 0)")
+        vertnbr, edgenbr, file_baseval, flagval = (int(t) for t in tokens[1:5])
+        if file_baseval not in (0, 1):
+            raise ValueError(f"{filename}: invalid base value {file_baseval}")
+        has_labels = (flagval // 100) % 10 != 0
+        has_edlo = (flagval // 10) % 10 != 0
+        has_velo = flagval % 10 != 0
+        if baseval == -1:
+            baseval = file_baseval
+
+        # Per-vertex layout: [label] [load] degree, then degree x ([load] end)
+        head = 1 + has_labels + has_velo
+        stride = 1 + has_edlo
+        body = tokens[5:]
+        starts = np.empty(vertnbr, dtype=np.int64)
+        degrees = np.empty(vertnbr, dtype=np.int64)
+        pos = 0
+        try:
+            for v in range(vertnbr):
+                starts[v] = pos
+                degrees[v] = body[pos + head - 1]
+                pos += head + int(degrees[v]) * stride
+        except IndexError:
+            raise ValueError(f"{filename}: truncated graph data") from None
+        if pos != len(body):
+            raise ValueError(f"{filename}: truncated graph data or trailing tokens")
+        if int(degrees.sum()) != edgenbr:
+            raise ValueError(
+                f"{filename}: header announces {edgenbr} arcs, adjacency lists hold "
+                f"{int(degrees.sum())}"
+            )
+
+        scotch_dtype = _SCOTCH_DTYPE
+        verttab = _aligned_empty(vertnbr + 1, scotch_dtype)
+        verttab[0] = 0
+        np.cumsum(degrees, out=verttab[1:])
+
+        # Token index of each arc's first field. verttab may be 32-bit: widen
+        # it before scaling by the stride so large arc counts cannot overflow
+        arc_pos = np.repeat(starts + head - verttab[:-1].astype(np.int64) * stride, degrees)
+        arc_pos += np.arange(edgenbr, dtype=np.int64) * stride
+        ends = body[arc_pos + has_edlo]
+        if has_labels:
+            # Arc ends are vertex labels: renumber them to vertex indices
+            labels = body[starts]
+            order = np.argsort(labels, kind="stable")
+            slot = np.searchsorted(labels, ends, sorter=order)
+            slot[slot == vertnbr] = 0
+            ends_idx = order[slot]
+            if not np.array_equal(labels[ends_idx], ends):
+                raise ValueError(f"{filename}: arc end refers to an unknown vertex label")
+            edgetab = _aligned_copy(ends_idx + baseval, scotch_dtype)
+        else:
+            edgetab = _aligned_copy(ends - file_baseval + baseval, scotch_dtype)
+        verttab += baseval
+
+        velotab = body[starts + head - 2].astype(scotch_dtype) if has_velo else None
+        edlotab = body[arc_pos].astype(scotch_dtype) if has_edlo else None
+
+        graph = Graph()
+        graph._build_raw(verttab, edgetab, velotab, edlotab, baseval)
+        return graph
+
+    @highlevel_api(scotch_functions=["SCOTCH_graphData"])
+    def save_binary(self, filename: Union[str, Path], half_edges: bool = False) -> None:
+        """
+        Save the graph as raw SCOTCH_Num arrays, for fast reloading.
+
+        The file holds a small header followed by the 0-based compact CSR
+        arrays (and vertex/edge loads when present) exactly as they sit in
+        memory, so load_binary() needs no parsing at all. It is not portable
+        across byte orders, and Scotch's own tools cannot read it.
+
+        With ``half_edges=True`` only the ``u < v`` arc of each edge is
+        stored, which halves the edge arrays on disk; load_binary() rebuilds
+        the reverse arcs. Scotch graphs are symmetric, so nothing is lost,
+        but neighbour order within each vertex is not preserved.
+
+        Args:
+            filename: Output file path
+            half_edges: Store each undirected edge once
+
+        Raises:
+            ValueError: If half_edges is set and the graph has self-loops or
+                is not symmetric
+        """
+        indptr, indices, edlotab = self._csr_arrays()
+        vertnbr = len(indptr) - 1
+        _, _, _, _, velotab_p, _, _ = self._graph_data()
+        velotab = None
+        if vertnbr > 0 and bool(velotab_p):
+            velotab = np.ctypeslib.as_array(velotab_p, shape=(vertnbr,))
+
+        flags = (_BINARY_HAS_VELO if velotab is not None else 0) | (
+            _BINARY_HAS_EDLO if edlotab is not None else 0
+        )
+        version = _BINARY_VERSION
+        if half_edges:
+            src = np.repeat(np.arange(vertnbr, dtype=indices.dtype), np.diff(indptr))
+            upper = indices > src
+            if 2 * int(np.count_nonzero(upper)) != len(indices):
+                raise ValueError("half_edges requires a symmetric graph without self-loops")
+            half_indptr = np.zeros(vertnbr + 1, dtype=indptr.dtype)
+            np.cumsum(np.bincount(src[upper], minlength=vertnbr), out=half_indptr[1:])
+            indptr, indices = half_indptr, indices[upper]
+            if edlotab is not None:
+                edlotab = edlotab[upper]
+            flags |= _BINARY_HALF_EDGES
+            version = _BINARY_HALF_VERSION
+
+        header = np.zeros(_BINARY_HEADER_LEN, dtype=np.int64)
+        header[:6] = (
+            _BINARY_MAGIC,
+            version,
+            lib.get_scotch_int_size(),
+            vertnbr,
+            len(indices),
+            flags,
+        )
+        scotch_dtype = _SCOTCH_DTYPE
+        with open(filename, "wb", buffering=_IO_BUFFER_SIZE) as f:
+            header.tofile(f)
+            for tab in (indptr, indices, velotab, edlotab):
+                if tab is not None:
+                    np.ascontiguousarray(tab, dtype=scotch_dtype).tofile(f)
+
+    @staticmethod
+    @highlevel_api(scotch_functions=["SCOTCH_graphInit", "SCOTCH_graphBuild"])
+    def load_binary(filename: Union[str, Path], memory_map: bool = False) -> "Graph":
+        """
+        Load a graph written by save_binary().
+
+        The arrays are read with one np.fromfile call each, no parsing.
+        With ``memory_map=True`` they are not read at all: the graph is built
+        directly on copy-on-write np.memmap views of the file, so pages are
+        faulted in as Scotch touches them and a reload of a file already in
+        the page cache is nearly instant.
+
+        Files written with ``half_edges=True`` are expanded back to the full
+        symmetric arrays in memory, so ``memory_map`` only saves the reads.
+
+        Args:
+            filename: Path written by save_binary()
+            memory_map: Build the graph on memory-mapped file views
+
+        Returns:
+            New Graph instance (0-based)
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a pyscotch binary graph, or was
+                written with another SCOTCH_Num width
+        """
+        filename = Path(filename)
+        if not filename.exists():
+            raise FileNotFoundError(f"Graph file not found: {filename}")
+
+        header = np.fromfile(filename, dtype=np.int64, count=_BINARY_HEADER_LEN)
+        if len(header) < _BINARY_HEADER_LEN or header[0] != _BINARY_MAGIC:
+            raise ValueError(f"{filename} is not a pyscotch binary graph file")
+        version, int_size, vertnbr, edgenbr, flags = (int(v) for v in header[1:6])
+        if version not in (_BINARY_VERSION, _BINARY_HALF_VERSION):
+            raise ValueError(f"{filename}: unsupported binary graph version {version}")
+        if int_size != lib.get_scotch_int_size():
+            raise ValueError(
+                f"{filename} holds {int_size}-bit arrays but the loaded Scotch uses "
+                f"{lib.get_scotch_int_size()}-bit SCOTCH_Num"
+            )
+
+        scotch_dtype = _SCOTCH_DTYPE
+        counts = [vertnbr + 1, edgenbr]
+        counts.append(vertnbr if flags & _BINARY_HAS_VELO else 0)
+        counts.append(edgenbr if flags & _BINARY_HAS_EDLO else 0)
+        itemsize = np.dtype(scotch_dtype).itemsize
+        expected = header.nbytes + sum(counts) * itemsize
+        if filename.stat().st_size != expected:
+            raise ValueError(
+                f"{filename}: size {filename.stat().st_size} does not match its header "
+                f"({expected} bytes expected)"
+            )
+
+        tabs = []
+        offset = header.nbytes
+        with open(filename, "rb", buffering=0) as f:
+            for count in counts:
+                if count == 0:
+                    tabs.append(None)
+                elif memory_map:
+                    tabs.append(
+                        np.memmap(f, dtype=scotch_dtype, mode="c", offset=offset, shape=(count,))
+                    )
+                else:
+                    f.seek(offset)
+                    tabs.append(np.fromfile(f, dtype=scotch_dtype, count=count))
+                offset += count * itemsize
+        verttab, edgetab, velotab, edlotab = tabs
+        if edgetab is None:
+            edgetab = np.empty(0, dtype=scotch_dtype)
+        if flags & _BINARY_HALF_EDGES:
+            verttab, edgetab, edlotab = _expand_half_csr(verttab, edgetab, edlotab)
+
+        graph = Graph()
+        graph._build_raw(verttab, edgetab, velotab, edlotab, 0)
+        return graph
+
     @scotch_binding(
         "SCOTCH_graphBuild",
         "int SCOTCH_graphBuild(SCOTCH_Graph *, SCOTCH_Num, SCOTCH_Num, SCOTCH_Num *, SCOTCH_Num *, SCOTCH_Num *, SCOTCH_Num *, SCOTCH_Num, SCOTCH_Num *, SCOTCH_Num *)",
@@ -283,30 +836,69 @@ class Graph:
         velotab: Optional[np.ndarray] = None,
         edlotab: Optional[np.ndarray] = None,
         baseval: int = 0,
+        vendtab: Optional[np.ndarray] = None,
+        vlbltab: Optional[np.ndarray] = None,
     ) -> None:
         """
         Build a graph from arrays.
 
+        Calling build() on a graph that already holds data replaces it in the
+        same Scotch structure (see free()).
+
+        Arrays that are already contiguous, writable and of the Scotch integer
+        dtype (``lib.get_scotch_dtype()``) are used in place, like
+        SCOTCH_graphBuild does in C: modifying them afterwards modifies the
+        graph, and base() renumbers them in place. Any other input, including
+        a read-only buffer, is converted into a private copy.
+
+        Besides NumPy arrays and sequences, any buffer-protocol object is
+        accepted (memoryview, array.array, bytes, mmap), so data read from a
+        binary file or another library can be built without a NumPy detour;
+        untyped byte buffers are read as native SCOTCH_Num values.
+
+        Every SCOTCH_graphBuild array can be handed over this way, including
+        the non-compact form: with ``vendtab``, vertex i's arcs are
+        ``edgetab[verttab[i]-baseval : vendtab[i]-baseval]`` and verttab has
+        one entry per vertex, so edgetab may keep unused slots.
+
         Args:
             verttab: Vertex array (start indices in edgetab for each vertex)
             edgetab: Edge array (adjacent vertices)
             velotab: Vertex weights (optional)
-            edlotab: Edge weights (optional)
+            edlotab: Edge weights (optional), indexed like edgetab
             baseval: Base value for indexing (0 or 1)
+            vendtab: Vertex end array (optional); without it the graph is
+                compact and verttab has one more entry than vertices
+            vlbltab: Vertex labels (optional)
 
         Raises:
             ValueError: If input arrays are invalid
             RuntimeError: If building fails
         """
+        verttab, edgetab, velotab, edlotab, vendtab, vlbltab = (
+            _from_buffer(tab) for tab in (verttab, edgetab, velotab, edlotab, vendtab, vlbltab)
+        )
+
         # Input validation
-        if len(verttab) < 2:
+        if vendtab is None and len(verttab) < 2:
             raise ValueError("verttab must have at least 2 elements (for 1 vertex)")
+        if vendtab is not None and len(verttab) < 1:
+            raise ValueError("verttab must have at least 1 element when vendtab is given")
         if baseval not in (0, 1):
             raise ValueError(f"baseval must be 0 or 1, got {baseval}")
 
-        vertnbr = len(verttab) - 1
+        vertnbr = len(verttab) - 1 if vendtab is None else len(verttab)
         edgenbr = len(edgetab)
 
+        if vendtab is not None and len(vendtab) != vertnbr:
+            raise ValueError(
+                f"vendtab length ({len(vendtab)}) must match verttab length ({vertnbr})"
+            )
+        if vlbltab is not None and len(vlbltab) != vertnbr:
+            raise ValueError(
+                f"vlbltab length ({len(vlbltab)}) must match number of vertices ({vertnbr})"
+            )
+
         # Validate vertex weights array size if provided
         if velotab is not None and len(velotab) != vertnbr:
             raise ValueError(
@@ -319,40 +911,80 @@ class Graph:
                 f"edlotab length ({len(edlotab)}) must match number of edges ({edgenbr})"
             )
 
-        # Store arrays to prevent garbage collection
         # Use dtype matching the compiled Scotch library (detected at import)
-        scotch_dtype = lib.get_scotch_dtype()
-        self._verttab = verttab.astype(scotch_dtype)
-        self._edgetab = edgetab.astype(scotch_dtype)
-        self._velotab = velotab.astype(scotch_dtype) if velotab is not None else None
-        self._edlotab = edlotab.astype(scotch_dtype) if edlotab is not None else None
-
-        # Convert to ctypes arrays
-        verttab_c = self._verttab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-        edgetab_c = self._edgetab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-
-        velotab_c = (
-            self._velotab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-            if self._velotab is not None
-            else None
-        )
-        edlotab_c = (
-            self._edlotab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-            if self._edlotab is not None
-            else None
+        scotch_dtype = _SCOTCH_DTYPE
+        self._build_raw(
+            _as_scotch_array(verttab, scotch_dtype),
+            _as_scotch_array(edgetab, scotch_dtype),
+            _as_scotch_array(velotab, scotch_dtype) if velotab is not None else None,
+            _as_scotch_array(edlotab, scotch_dtype) if edlotab is not None else None,
+            baseval,
+            vendtab=_as_scotch_array(vendtab, scotch_dtype) if vendtab is not None else None,
+            vlbltab=_as_scotch_array(vlbltab, scotch_dtype) if vlbltab is not None else None,
         )
 
-        # Pass verttab as vendtab to trigger Scotch's (vendtab == verttab) check
-        # which automatically uses verttab[i+1] as the end index for vertex i
-        ret = lib.SCOTCH_graphBuild(
-            byref(self._graph),
-            lib.SCOTCH_Num(baseval),
-            lib.SCOTCH_Num(vertnbr),
+    @internal_api
+    def _build_raw(
+        self,
+        verttab: np.ndarray,
+        edgetab: np.ndarray,
+        velotab: Optional[np.ndarray],
+        edlotab: Optional[np.ndarray],
+        baseval: int,
+        vendtab: Optional[np.ndarray] = None,
+        vlbltab: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Call SCOTCH_graphBuild on already-prepared arrays, without copying.
+
+        The arrays must be C-contiguous, writable, of the Scotch integer
+        dtype, and consistent with each other (build() validates user input, then calls
+        this). They are kept as-is on the instance, since Scotch references
+        them for the lifetime of the graph. Without vendtab the graph is
+        compact (verttab has vertnbr + 1 entries).
+        """
+        if vendtab is None:
+            vertnbr = len(verttab) - 1
+            edgenbr = len(edgetab)
+        else:
+            vertnbr = len(verttab)
+            # Arcs actually in use; edgetab may keep unused slots between them
+            edgenbr = int(np.subtract(vendtab, verttab).sum())
+
+        # Rebuilding keeps the initialized structure: only release what a
+        # previous build/load left in it (a no-op on a fresh graph)
+        self.free()
+
+        # Store arrays to prevent garbage collection
+        self._verttab = verttab
+        self._vendtab = vendtab
+        self._vlbltab = vlbltab
+        self._edgetab = edgetab
+        self._velotab = velotab
+        self._edlotab = edlotab
+
+        # Raw addresses for lib.raw_function; the arrays are held above
+        verttab_c = verttab.ctypes.data
+        edgetab_c = edgetab.ctypes.data
+        velotab_c = velotab.ctypes.data if velotab is not None else None
+        vlbltab_c = vlbltab.ctypes.data if vlbltab is not None else None
+        edlotab_c = edlotab.ctypes.data if edlotab is not None else None
+        # For a compact graph, pass verttab as vendtab to trigger Scotch's
+        # (vendtab == verttab) check, which then uses verttab[i+1] as the end
+        # index for vertex i.
+        vendtab_c = vendtab.ctypes.data if vendtab is not None else verttab_c
+
+        # Scalars are passed as plain ints: the argtypes declare SCOTCH_Num, so
+        # ctypes converts them natively without a wrapper object per argument.
+        ret = lib.raw_function("SCOTCH_graphBuild")(
+            self._graph_addr,
+            int(baseval),
+            vertnbr,
             verttab_c,
-            verttab_c,  # Same pointer as verttab - Scotch will use verttab[i+1]
+            vendtab_c,
             velotab_c,
-            None,  # vlbltab
-            lib.SCOTCH_Num(edgenbr),
+            vlbltab_c,
+            edgenbr,
             edgetab_c,
             edlotab_c,
         )
@@ -361,16 +993,26 @@ class Graph:
             raise lib.scotch_error(
                 f"Failed to build graph with {vertnbr} vertices and {edgenbr} edges", ret
             )
+        self._size_cache = (vertnbr, edgenbr)
+
+    @internal_api
+    def _invalidate_caches(self) -> None:
+        """Forget the cached size() result; call whenever Scotch rewrites the graph."""
+        self._size_cache = None
 
     @scotch_binding("SCOTCH_graphCheck", "int SCOTCH_graphCheck(const SCOTCH_Graph *)")
     def check(self) -> bool:
         """
         Check the consistency of the graph structure.
 
+        Every call walks the whole graph (O(V+E)). The result is not cached:
+        arrays passed to build() may be used in place, so the caller can
+        change the graph behind Scotch's back at any time.
+
         Returns:
             True if the graph is valid, False otherwise
         """
-        ret = lib.SCOTCH_graphCheck(byref(self._graph))
+        ret = lib.SCOTCH_graphCheck(self._graph)
         return ret == 0
 
     @scotch_binding(
@@ -381,19 +1023,28 @@ class Graph:
         """
         Get the size of the graph.
 
+        The sizes are known after build() and queried once after load(), so
+        partition()/order() do not pay a Scotch call each time.
+
         Returns:
             Tuple of (number of vertices, number of edges)
         """
-        vertnbr = lib.SCOTCH_Num()
-        edgenbr = lib.SCOTCH_Num()
-        lib.SCOTCH_graphSize(byref(self._graph), byref(vertnbr), byref(edgenbr))
-        return (vertnbr.value, edgenbr.value)
+        if self._size_cache is None:
+            vertnbr = lib.SCOTCH_Num()
+            edgenbr = lib.SCOTCH_Num()
+            lib.SCOTCH_graphSize(self._graph, byref(vertnbr), byref(edgenbr))
+            self._size_cache = (vertnbr.value, edgenbr.value)
+        return self._size_cache
 
     @scotch_binding("SCOTCH_graphBase", "SCOTCH_Num SCOTCH_graphBase(SCOTCH_Graph *, SCOTCH_Num)")
     def base(self, baseval: int) -> int:
         """
         Set the base value for vertex numbering.
 
+        Scotch renumbers verttab, vendtab and edgetab in place, which takes
+        O(V+E) time. Arrays that build() used without copying belong to the
+        caller, so the caller's arrays are rewritten too.
+
         Args:
             baseval: New base value (0 or 1)
 
@@ -405,7 +1056,7 @@ class Graph:
         """
         if baseval not in (0, 1):
             raise ValueError(f"baseval must be 0 or 1, got {baseval}")
-        old_baseval = lib.SCOTCH_graphBase(byref(self._graph), lib.SCOTCH_Num(baseval))
+        old_baseval = lib.SCOTCH_graphBase(self._graph, lib.SCOTCH_Num(baseval))
         return old_baseval
 
     @scotch_binding("SCOTCH_graphStat", "void SCOTCH_graphStat(const SCOTCH_Graph *, ...)")
@@ -435,7 +1086,7 @@ class Graph:
         edlodlt = ctypes.c_double()
 
         lib.SCOTCH_graphStat(
-            byref(self._graph),
+            self._graph,
             byref(velomin),
             byref(velomax),
             byref(velosum),
@@ -465,6 +1116,7 @@ class Graph:
 
     @highlevel_api(
         scotch_functions=[
+            "SCOTCH_graphPart",
             "SCOTCH_graphMapInit",
             "SCOTCH_graphMapCompute",
             "SCOTCH_graphMapExit",
@@ -474,6 +1126,8 @@ class Graph:
         self,
         nparts: int,
         strategy=None,
+        copy: bool = True,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         Partition the graph into a specified number of parts.
@@ -481,36 +1135,38 @@ class Graph:
         Args:
             nparts: Number of partitions
             strategy: Partitioning strategy (optional)
+            copy: If False, write into a buffer owned by the graph and return
+                a view of it; the next partition(copy=False) call overwrites
+                it. Useful for parameter sweeps on large graphs.
+            out: Caller-provided array to write the result into and return;
+                must be C-contiguous, of the Scotch dtype and of length
+                vertnbr. Takes precedence over ``copy``.
 
         Returns:
             Array of partition assignments for each vertex
 
         Raises:
-            ValueError: If nparts is invalid
+            ValueError: If nparts or out is invalid
             RuntimeError: If partitioning fails
 
         Note:
             Scotch's PRNG state carries across calls; for reproducible results
             call ``pyscotch.random_reset()`` before this operation.
+
+            The GIL is released while Scotch computes, so distinct graphs can
+            be partitioned concurrently from a thread pool (one Strategy may
+            be shared across those threads).
         """
         if nparts < 1:
             raise ValueError(f"nparts must be at least 1, got {nparts}")
 
-        from .strategy import Strategy
-        from .arch import Architecture
-
         vertnbr, _ = self.size()
 
         if nparts > vertnbr:
             raise ValueError(f"nparts ({nparts}) cannot exceed number of vertices ({vertnbr})")
 
         # Create partition array (dtype matches compiled Scotch)
-        parttab = np.zeros(vertnbr, dtype=lib.get_scotch_dtype())
-        parttab_c = parttab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-
-        # Create architecture
-        arch = Architecture()
-        arch.complete(nparts)
+        parttab = self._output_array("parttab", vertnbr, copy, out)
 
         # A fresh Strategy is Scotch's default; deferred requests (flag builds,
         # constructor strings) need nparts and are built per call.
@@ -518,36 +1174,160 @@ class Graph:
             strategy = Strategy()
 
         with strategy._materialized_mapping(nparts) as stratdat:
-            # Use 3-step API: Init -> Compute -> Exit
-            # This is the recommended pattern from Scotch C examples
-            mappdat = lib.SCOTCH_Mapping()
-
-            # Step 1: Initialize mapping
-            ret = lib.SCOTCH_graphMapInit(
-                byref(self._graph),
-                byref(mappdat),
-                byref(arch._arch),
-                parttab_c,
-            )
-            if ret != 0:
-                raise lib.scotch_error(f"Failed to initialize mapping for {nparts} parts", ret)
+            if _HAVE_GRAPH_PART:
+                # Single call: Scotch builds the complete-graph target and
+                # mapping internally, with no Python-side objects per call
+                ret = lib.raw_function("SCOTCH_graphPart")(
+                    self._graph_addr, nparts, addressof(stratdat), parttab.ctypes.data
+                )
+                if ret != 0:
+                    raise lib.scotch_error(
+                        f"Failed to compute partition into {nparts} parts ({vertnbr} vertices)",
+                        ret,
+                    )
+            else:
+                arch = Architecture()
+                arch.complete(nparts)
+                self._map_compute(arch, stratdat, nparts, parttab)
 
-            # Step 2: Compute mapping
-            ret = lib.SCOTCH_graphMapCompute(
-                byref(self._graph),
-                byref(mappdat),
-                byref(stratdat),
-            )
+        return parttab
+
+    @internal_api
+    def _map_compute(self, arch, stratdat, nparts: int, parttab: np.ndarray) -> None:
+        """Run SCOTCH_graphMapInit/Compute/Exit into parttab (Scotch dtype, contiguous)."""
+        # Use 3-step API: Init -> Compute -> Exit
+        # This is the recommended pattern from Scotch C examples
+        mappdat = lib.SCOTCH_Mapping()
+        mappdat_addr = addressof(mappdat)
+
+        # Step 1: Initialize mapping
+        ret = lib.raw_function("SCOTCH_graphMapInit")(
+            self._graph_addr,
+            mappdat_addr,
+            addressof(arch._arch),
+            parttab.ctypes.data,
+        )
+        if ret != 0:
+            raise lib.scotch_error(f"Failed to initialize mapping for {nparts} parts", ret)
 
-            # Step 3: Clean up mapping (always, even on error)
-            lib.SCOTCH_graphMapExit(byref(self._graph), byref(mappdat))
+        # Step 2: Compute mapping
+        ret = lib.raw_function("SCOTCH_graphMapCompute")(
+            self._graph_addr,
+            mappdat_addr,
+            addressof(stratdat),
+        )
+
+        # Step 3: Clean up mapping (always, even on error)
+        lib.raw_function("SCOTCH_graphMapExit")(self._graph_addr, mappdat_addr)
 
         if ret != 0:
             raise lib.scotch_error(
-                f"Failed to compute partition into {nparts} parts ({vertnbr} vertices)", ret
+                f"Failed to compute partition into {nparts} parts ({self.size()[0]} vertices)",
+                ret,
             )
 
-        return parttab
+    @staticmethod
+    @highlevel_api(
+        scotch_functions=[
+            "SCOTCH_graphPart",
+            "SCOTCH_archInit",
+            "SCOTCH_archCmplt",
+            "SCOTCH_graphMapInit",
+            "SCOTCH_graphMapCompute",
+            "SCOTCH_graphMapExit",
+        ]
+    )
+    def partition_batch(graphs, nparts: int, strategy=None, threads: int = 1) -> List[np.ndarray]:
+        """
+        Partition several graphs into the same number of parts.
+
+        Equivalent to ``[g.partition(nparts, strategy) for g in graphs]``, but
+        the strategy is materialized once for the whole batch, or once per
+        worker thread when threads > 1 (and, without SCOTCH_graphPart, the
+        target architecture built once), instead of per graph. Worth it for
+        many small graphs, where that setup dominates the partitioning itself.
+
+        Args:
+            graphs: Iterable of Graph instances
+            nparts: Number of partitions, for every graph
+            strategy: Partitioning strategy (optional), shared by all graphs
+            threads: Number of graphs partitioned concurrently. Scotch runs
+                without the GIL, so values above 1 overlap the partitionings
+                of distinct graphs on a thread pool.
+
+        Returns:
+            List of partition arrays, one per graph, in input order
+
+        Raises:
+            ValueError: If nparts or threads is invalid for any of the graphs
+            RuntimeError: If partitioning fails
+        """
+        if nparts < 1:
+            raise ValueError(f"nparts must be at least 1, got {nparts}")
+        if threads < 1:
+            raise ValueError(f"threads must be at least 1, got {threads}")
+
+        graphs = list(graphs)
+        for graph in graphs:
+            vertnbr, _ = graph.size()
+            if nparts > vertnbr:
+                raise ValueError(f"nparts ({nparts}) cannot exceed number of vertices ({vertnbr})")
+
+        if strategy is None:
+            strategy = Strategy()
+
+        results = [graph._output_array("parttab", graph.size()[0], True) for graph in graphs]
+        sequential = threads == 1 or len(graphs) < 2
+        with ExitStack() as stack:
+            if sequential:
+                stratdat = stack.enter_context(strategy._materialized_mapping(nparts))
+
+                def strat_for_thread():
+                    return stratdat
+
+            else:
+                # Scotch builds its default strategy into the strat it is first
+                # handed, so concurrent workers must not share one: each pool
+                # thread materializes its own, freed once the pool has joined
+                per_thread = threading.local()
+                stack_lock = threading.Lock()
+
+                def strat_for_thread():
+                    strat = getattr(per_thread, "stratdat", None)
+                    if strat is None:
+                        with stack_lock:
+                            strat = stack.enter_context(strategy._materialized_mapping(nparts))
+                        per_thread.stratdat = strat
+                    return strat
+
+            if _HAVE_GRAPH_PART:
+                graph_part = lib.raw_function("SCOTCH_graphPart")
+
+                def run(graph, parttab):
+                    strat_addr = addressof(strat_for_thread())
+                    ret = graph_part(graph._graph_addr, nparts, strat_addr, parttab.ctypes.data)
+                    if ret != 0:
+                        raise lib.scotch_error(
+                            f"Failed to compute partition into {nparts} parts "
+                            f"({len(parttab)} vertices)",
+                            ret,
+                        )
+
+            else:
+                arch = stack.enter_context(Architecture())
+                arch.complete(nparts)
+
+                def run(graph, parttab):
+                    graph._map_compute(arch, strat_for_thread(), nparts, parttab)
+
+            if sequential:
+                for graph, parttab in zip(graphs, results):
+                    run(graph, parttab)
+            else:
+                with ThreadPoolExecutor(max_workers=threads) as pool:
+                    # list() re-raises the first failure, in input order
+                    list(pool.map(run, graphs, results))
+        return results
 
     @scotch_binding(
         "SCOTCH_graphOrder",
@@ -556,46 +1336,53 @@ class Graph:
     def order(
         self,
         strategy=None,
+        copy: bool = True,
+        permtab_out: Optional[np.ndarray] = None,
+        peritab_out: Optional[np.ndarray] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Compute an ordering of the graph vertices (for sparse matrix factorization).
 
         Args:
             strategy: Ordering strategy (optional)
+            copy: If False, write into buffers owned by the graph and return
+                views of them; the next order(copy=False) call overwrites them.
+            permtab_out: Caller-provided array for the permutation (same
+                requirements as ``out`` in partition())
+            peritab_out: Caller-provided array for the inverse permutation
 
         Returns:
             Tuple of (permutation array, inverse permutation array)
 
         Raises:
+            ValueError: If an output array is invalid
             RuntimeError: If ordering fails
 
         Note:
             Scotch's PRNG state carries across calls; for reproducible results
             call ``pyscotch.random_reset()`` before this operation.
-        """
-        from .strategy import Strategy
 
+            The GIL is released while Scotch computes, so distinct graphs can
+            be ordered concurrently from a thread pool.
+        """
         vertnbr, _ = self.size()
 
         # Create ordering arrays (dtype matches compiled Scotch)
-        permtab = np.zeros(vertnbr, dtype=lib.get_scotch_dtype())
-        peritab = np.zeros(vertnbr, dtype=lib.get_scotch_dtype())
+        permtab = self._output_array("permtab", vertnbr, copy, permtab_out)
+        peritab = self._output_array("peritab", vertnbr, copy, peritab_out)
         cblkptr = lib.SCOTCH_Num()
 
-        permtab_c = permtab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-        peritab_c = peritab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-
         # Use provided strategy or create default
         if strategy is None:
             strategy = Strategy()
 
         with strategy._materialized_ordering() as stratdat:
-            ret = lib.SCOTCH_graphOrder(
-                byref(self._graph),
-                byref(stratdat),
-                permtab_c,
-                peritab_c,
-                byref(cblkptr),
+            ret = lib.raw_function("SCOTCH_graphOrder")(
+                self._graph_addr,
+                addressof(stratdat),
+                permtab.ctypes.data,
+                peritab.ctypes.data,
+                addressof(cblkptr),
                 None,  # rangtab
                 None,  # treetab
             )
@@ -605,19 +1392,59 @@ class Graph:
 
         return permtab, peritab
 
+    @internal_api
+    def _output_array(
+        self, name: str, size: int, copy: bool, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Return an output array of ``size`` Scotch integers.
+
+        A caller-provided ``out`` is validated and returned. With
+        ``copy=True`` this is a fresh array owned by the caller. Otherwise
+        it is a view of a per-graph scratch buffer kept under ``name``, grown
+        as needed and reused by later calls.
+
+        The array is not initialized: its callers (partition, order, color)
+        pass it to Scotch routines that write every entry, so zero-filling
+        would be a wasted pass over O(V) memory.
+        """
+        scotch_dtype = _SCOTCH_DTYPE
+        if out is not None:
+            if not isinstance(out, np.ndarray):
+                raise ValueError(f"{name} output must be a numpy array")
+            if out.shape != (size,):
+                raise ValueError(f"{name} output must have shape ({size},), got {out.shape}")
+            if out.dtype != scotch_dtype:
+                raise ValueError(f"{name} output must have dtype {scotch_dtype}, got {out.dtype}")
+            if not out.flags.c_contiguous or not out.flags.writeable:
+                raise ValueError(f"{name} output must be C-contiguous and writeable")
+            return out
+        if copy:
+            return np.empty(size, dtype=scotch_dtype)
+        buf = self._scratch.get(name)
+        if buf is None or buf.size < size or buf.dtype != scotch_dtype:
+            buf = np.empty(size, dtype=scotch_dtype)
+            self._scratch[name] = buf
+        return buf[:size]
+
     @highlevel_api(scotch_functions=["SCOTCH_graphColor"])
-    def color(self) -> Tuple[np.ndarray, int]:
+    def color(self, out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, int]:
         """
         Compute a graph coloring (vertex coloring).
 
         Returns a coloring where no two adjacent vertices have the same color.
 
+        Args:
+            out: Caller-provided array for the colors (same requirements as
+                ``out`` in partition())
+
         Returns:
             Tuple of (color array, number of colors used)
             - color array: Array of color assignments for each vertex (0-based)
             - number of colors: Total number of colors used
 
         Raises:
+            ValueError: If out is invalid
             RuntimeError: If coloring fails
 
         Note:
@@ -627,16 +1454,16 @@ class Graph:
         vertnbr, _ = self.size()
 
         # Create color array (dtype matches compiled Scotch)
-        colotab = np.zeros(vertnbr, dtype=lib.get_scotch_dtype())
+        colotab = self._output_array("colotab", vertnbr, True, out)
         colonbr = lib.SCOTCH_Num()
 
-        colotab_c = colotab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        colotab_c = _num_ptr(colotab)
 
         ret = lib.SCOTCH_graphColor(
-            byref(self._graph),
+            self._graph,
             colotab_c,
             byref(colonbr),
-            lib.SCOTCH_Num(0),  # flagval = 0
+            0,  # flagval
         )
 
         if ret != 0:
@@ -667,15 +1494,15 @@ class Graph:
         indvertnbr = len(vertex_list)
 
         # Convert vertex list to Scotch dtype
-        scotch_dtype = lib.get_scotch_dtype()
+        scotch_dtype = _SCOTCH_DTYPE
         vertex_list_scotch = vertex_list.astype(scotch_dtype)
-        vertex_list_c = vertex_list_scotch.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        vertex_list_c = _num_ptr(vertex_list_scotch)
 
         # Create new graph for induced subgraph
         induced_graph = Graph()
 
         ret = lib.SCOTCH_graphInduceList(
-            byref(self._graph),
+            self._graph,
             lib.SCOTCH_Num(indvertnbr),
             vertex_list_c,
             byref(induced_graph._graph),
@@ -690,13 +1517,17 @@ class Graph:
         "SCOTCH_graphInducePart",
         "int SCOTCH_graphInducePart(const SCOTCH_Graph *, SCOTCH_Num, const SCOTCH_GraphPart2 *, SCOTCH_GraphPart2, SCOTCH_Graph *)",
     )
-    def induce_part(self, partition: np.ndarray, part_id: int) -> "Graph":
+    def induce_part(
+        self, partition: np.ndarray, part_id: int, vertex_count: Optional[int] = None
+    ) -> "Graph":
         """
         Create an induced subgraph from vertices in a specific partition.
 
         Args:
             partition: Array of partition assignments for each vertex
             part_id: Partition ID to extract (vertices with this partition value)
+            vertex_count: Number of vertices in ``part_id``, if already known
+                (e.g. from np.bincount); skips a scan of ``partition``
 
         Returns:
             New Graph instance containing vertices from the specified partition
@@ -704,20 +1535,63 @@ class Graph:
         Raises:
             RuntimeError: If induction fails
         """
-        vertnbr, _ = self.size()
+        if vertex_count is None:
+            vertex_count = int(np.count_nonzero(partition == part_id))
+
+        # GraphPart2 type (unsigned char/ubyte); no copy if already uint8.
+        # Scotch copies what it needs into the induced graph.
+        partition_ubyte = np.ascontiguousarray(partition, dtype=np.uint8)
+        return self._induce_part_ubyte(partition_ubyte, part_id, vertex_count)
 
-        # Count vertices in the requested partition
-        indvertnbr = np.sum(partition == part_id)
+    @highlevel_api(scotch_functions=["SCOTCH_graphInducePart"])
+    def induce_parts(self, partition: np.ndarray) -> Dict[int, "Graph"]:
+        """
+        Split the graph into one induced subgraph per partition.
+
+        Equivalent to calling induce_part() for every part, but the partition
+        is converted and its part sizes counted once, instead of once per part.
+
+        Args:
+            partition: Array of partition assignments for each vertex, with
+                values in 0..255 (the range of SCOTCH_GraphPart2)
+
+        Returns:
+            Dict mapping each non-empty part ID to its induced subgraph
+
+        Raises:
+            ValueError: If partition has the wrong length or out-of-range values
+            RuntimeError: If induction fails
+        """
+        vertnbr, _ = self.size()
+        partition = np.asarray(partition)
+        if partition.shape != (vertnbr,):
+            raise ValueError(f"partition must have shape ({vertnbr},), got {partition.shape}")
+        if vertnbr == 0:
+            return {}
+        if partition.min() < 0 or partition.max() > 255:
+            raise ValueError("partition values must be in range 0..255")
+
+        partition_ubyte = np.ascontiguousarray(partition, dtype=np.uint8)
+        counts = np.bincount(partition_ubyte)
+        return {
+            int(part_id): self._induce_part_ubyte(
+                partition_ubyte, int(part_id), int(counts[part_id])
+            )
+            for part_id in np.flatnonzero(counts)
+        }
 
-        # Convert partition array to GraphPart2 type (unsigned char/ubyte)
-        partition_ubyte = partition.astype(np.uint8)
+    @internal_api
+    def _induce_part_ubyte(
+        self, partition_ubyte: np.ndarray, part_id: int, indvertnbr: int
+    ) -> "Graph":
+        """Run SCOTCH_graphInducePart on a contiguous uint8 partition array."""
         partition_c = partition_ubyte.ctypes.data_as(POINTER(lib.SCOTCH_GraphPart2))
 
         # Create new graph for induced subgraph
         induced_graph = Graph()
 
         ret = lib.SCOTCH_graphInducePart(
-            byref(self._graph),
+            self._graph,
             lib.SCOTCH_Num(indvertnbr),
             partition_c,
             lib.SCOTCH_GraphPart2(part_id),
@@ -752,12 +1626,12 @@ class Graph:
         """
         vertnbr, _ = self.size()
 
-        multinode = np.zeros(vertnbr * 2, dtype=lib.get_scotch_dtype())
-        multinode_c = multinode.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        multinode = np.zeros(vertnbr * 2, dtype=_SCOTCH_DTYPE)
+        multinode_c = _num_ptr(multinode)
 
         coarse = Graph()
         ret = lib.SCOTCH_graphCoarsen(
-            byref(self._graph),
+            self._graph,
             lib.SCOTCH_Num(min_vertices),
             float(coarrat),
             lib.SCOTCH_Num(flags),
@@ -790,12 +1664,12 @@ class Graph:
         """
         vertnbr, _ = self.size()
 
-        mate = np.zeros(vertnbr, dtype=lib.get_scotch_dtype())
-        mate_c = mate.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        mate = np.zeros(vertnbr, dtype=_SCOTCH_DTYPE)
+        mate_c = _num_ptr(mate)
         coar_vertnbr = lib.SCOTCH_Num(0)
 
         ret = lib.SCOTCH_graphCoarsenMatch(
-            byref(self._graph),
+            self._graph,
             byref(coar_vertnbr),
             float(coarrat),
             lib.SCOTCH_Num(flags),
@@ -825,12 +1699,12 @@ class Graph:
         """
         mate_arr, mate_c = lib.to_scotch_array(mate)
 
-        multinode = np.zeros(coar_vertnbr * 2, dtype=lib.get_scotch_dtype())
-        multinode_c = multinode.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        multinode = np.zeros(coar_vertnbr * 2, dtype=_SCOTCH_DTYPE)
+        multinode_c = _num_ptr(multinode)
 
         coarse = Graph()
         ret = lib.SCOTCH_graphCoarsenBuild(
-            byref(self._graph),
+            self._graph,
             lib.SCOTCH_Num(coar_vertnbr),
             mate_c,
             byref(coarse._graph),
@@ -865,8 +1739,6 @@ class Graph:
             Scotch's PRNG state carries across calls; for reproducible results
             call ``pyscotch.random_reset()`` before this operation.
         """
-        from .strategy import Strategy
-
         if strategy is None:
             strategy = Strategy()
 
@@ -874,7 +1746,7 @@ class Graph:
 
         with strategy._materialized_mapping(nparts) as stratdat:
             ret = lib.SCOTCH_graphPartFixed(
-                byref(self._graph),
+                self._graph,
                 lib.SCOTCH_Num(nparts),
                 byref(stratdat),
                 parttab_c,
@@ -906,23 +1778,21 @@ class Graph:
             Scotch's PRNG state carries across calls; for reproducible results
             call ``pyscotch.random_reset()`` before this operation.
         """
-        from .strategy import Strategy
-
         vertnbr, _ = self.size()
 
         # SCOTCH_graphPartOvl only writes entries a strategy method assigns; a
         # do-nothing strategy (e.g. "") leaves the buffer as-is, so pre-fill
         # with -1 ("in the overlap") rather than return zeros that would look
         # like a valid everything-in-part-0 result.
-        parttab = np.full(vertnbr, -1, dtype=lib.get_scotch_dtype())
-        parttab_c = parttab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        parttab = np.full(vertnbr, -1, dtype=_SCOTCH_DTYPE)
+        parttab_c = _num_ptr(parttab)
 
         if strategy is None:
             strategy = Strategy()
 
         with strategy._materialized_overlap(nparts) as stratdat:
             ret = lib.SCOTCH_graphPartOvl(
-                byref(self._graph),
+                self._graph,
                 lib.SCOTCH_Num(nparts),
                 byref(stratdat),
                 parttab_c,
@@ -959,8 +1829,6 @@ class Graph:
             Scotch's PRNG state carries across calls; for reproducible results
             call ``pyscotch.random_reset()`` before this operation.
         """
-        from .strategy import Strategy
-
         vertnbr, _ = self.size()
 
         if strategy is None:
@@ -968,14 +1836,14 @@ class Graph:
 
         old_part, old_part_c = lib.to_scotch_array(old_partition, copy=True)
 
-        parttab = np.zeros(vertnbr, dtype=lib.get_scotch_dtype())
-        parttab_c = parttab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        parttab = np.zeros(vertnbr, dtype=_SCOTCH_DTYPE)
+        parttab_c = _num_ptr(parttab)
 
         vmlotab_arr, vmlotab_c = lib.to_scotch_array_optional(vmlotab)
 
         with strategy._materialized_mapping(nparts) as stratdat:
             ret = lib.SCOTCH_graphRepart(
-                byref(self._graph),
+                self._graph,
                 lib.SCOTCH_Num(nparts),
                 old_part_c,
                 float(emrat),
@@ -1002,7 +1870,7 @@ class Graph:
         parttab_arr, parttab_c = lib.to_scotch_array(parttab)
         with _scotch_mapping(self._graph, arch._arch, parttab_c) as mappdat:
             with c_fopen(str(filename), "w") as fp:
-                ret = lib.SCOTCH_graphMapSave(byref(self._graph), byref(mappdat), fp)
+                ret = lib.SCOTCH_graphMapSave(self._graph, byref(mappdat), fp)
                 if ret != 0:
                     raise lib.scotch_error("Failed to save mapping", ret)
 
@@ -1019,7 +1887,7 @@ class Graph:
         parttab_arr, parttab_c = lib.to_scotch_array(parttab)
         with _scotch_mapping(self._graph, arch._arch, parttab_c) as mappdat:
             with c_fopen(str(filename), "w") as fp:
-                ret = lib.SCOTCH_graphMapView(byref(self._graph), byref(mappdat), fp)
+                ret = lib.SCOTCH_graphMapView(self._graph, byref(mappdat), fp)
                 if ret != 0:
                     raise lib.scotch_error("Failed to write mapping view", ret)
 
@@ -1038,7 +1906,7 @@ class Graph:
         permtab_arr, permtab_c = lib.to_scotch_array(permtab)
         peritab_arr, peritab_c = lib.to_scotch_array(peritab)
         with _scotch_ordering(self._graph, permtab_c, peritab_c) as orddat:
-            ret = lib.SCOTCH_graphOrderCheck(byref(self._graph), byref(orddat))
+            ret = lib.SCOTCH_graphOrderCheck(self._graph, byref(orddat))
             return ret == 0
 
     @scotch_binding("SCOTCH_graphOrderSave", "int SCOTCH_graphOrderSave(...)")
@@ -1057,7 +1925,7 @@ class Graph:
         peritab_arr, peritab_c = lib.to_scotch_array(peritab)
         with _scotch_ordering(self._graph, permtab_c, peritab_c) as orddat:
             with c_fopen(str(filename), "w") as fp:
-                ret = lib.SCOTCH_graphOrderSave(byref(self._graph), byref(orddat), fp)
+                ret = lib.SCOTCH_graphOrderSave(self._graph, byref(orddat), fp)
                 if ret != 0:
                     raise lib.scotch_error("Failed to save ordering", ret)
 
@@ -1072,7 +1940,7 @@ class Graph:
         """
         tab_arr, tab_c = lib.to_scotch_array(tab)
         with c_fopen(str(filename), "w") as fp:
-            ret = lib.SCOTCH_graphTabSave(byref(self._graph), tab_c, fp)
+            ret = lib.SCOTCH_graphTabSave(self._graph, tab_c, fp)
             if ret != 0:
                 raise lib.scotch_error("Failed to save tab", ret)
 
@@ -1088,11 +1956,11 @@ class Graph:
             Array of values (one per vertex)
         """
         vertnbr, _ = self.size()
-        tab = np.zeros(vertnbr, dtype=lib.get_scotch_dtype())
-        tab_c = tab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
+        tab = np.zeros(vertnbr, dtype=_SCOTCH_DTYPE)
+        tab_c = _num_ptr(tab)
 
         with c_fopen(str(filename), "r") as fp:
-            ret = lib.SCOTCH_graphTabLoad(byref(self._graph), tab_c, fp)
+            ret = lib.SCOTCH_graphTabLoad(self._graph, tab_c, fp)
             if ret != 0:
                 raise lib.scotch_error("Failed to load tab", ret)
 
@@ -1116,9 +1984,9 @@ class Graph:
         baseval = lib.SCOTCH_Num()
         vertnbr = lib.SCOTCH_Num()
         edgenbr = lib.SCOTCH_Num()
-        nullp = POINTER(lib.SCOTCH_Num)()
+        nullp = lib.SCOTCH_NumPtr()
         lib.SCOTCH_graphData(
-            byref(self._graph),
+            self._graph,
             byref(baseval),
             byref(vertnbr),
             byref(nullp),
@@ -1130,15 +1998,16 @@ class Graph:
             byref(nullp),
         )
         filename = Path(filename)
-        with open(filename, "w") as f:
+        mapping = np.asarray(mapping)
+        labels = np.arange(baseval.value, baseval.value + len(mapping))
+        with open(filename, "w", buffering=_IO_BUFFER_SIZE) as f:
             f.write(f"{len(mapping)}\n")
-            for i, part in enumerate(mapping):
-                f.write(f"{i + baseval.value}\t{part}\n")
+            _write_int_rows(f, (labels, mapping))
 
     @staticmethod
     @highlevel_api(scotch_functions=["SCOTCH_graphInit", "SCOTCH_graphBuild"])
     def from_edges(
-        edges: List[Tuple[int, int]],
+        edges: Union[List[Tuple[int, int]], np.ndarray],
         num_vertices: Optional[int] = None,
         vertex_weights: Optional[List[int]] = None,
         edge_weights: Optional[List[int]] = None,
@@ -1147,7 +2016,11 @@ class Graph:
         Create a graph from a list of edges.
 
         Args:
-            edges: List of (source, target) tuples
+            edges: List of (source, target) tuples, or an integer array of
+                shape (E, 2). The array form is the fast path for large
+                graphs: an array already of the Scotch integer dtype
+                (``lib.get_scotch_dtype()``) is used without copying, whereas
+                a list of tuples is first converted element by element.
             num_vertices: Number of vertices (auto-detected if None)
             vertex_weights: Optional list of vertex weights
             edge_weights: Optional list of edge weights
@@ -1158,88 +2031,123 @@ class Graph:
         Raises:
             ValueError: If edges list is empty or inputs are invalid
         """
-        if not edges:
+        if len(edges) == 0:
             raise ValueError("edges list cannot be empty")
 
-        if num_vertices is None:
-            num_vertices = max(max(e) for e in edges) + 1
-
-        # Validate vertex indices
-        max_vertex = max(max(e) for e in edges)
-        if max_vertex >= num_vertices:
+        scotch_dtype = _SCOTCH_DTYPE
+        edge_array = np.asarray(edges)
+        if edge_array.dtype != scotch_dtype:
+            edge_array = edge_array.astype(np.int64, copy=False)
+        if edge_array.ndim != 2 or edge_array.shape[1] != 2:
             raise ValueError(
-                f"Edge contains vertex {max_vertex} but num_vertices is {num_vertices}"
+                f"edges must be (source, target) pairs, got an array of shape {edge_array.shape}"
             )
 
+        if edge_array.min() < 0:
+            raise ValueError(f"Edge contains negative vertex {int(edge_array.min())}")
+        if edge_array.dtype != scotch_dtype:
+            # Narrow to SCOTCH_Num up front: with a 32-bit Scotch this halves
+            # every intermediate arc array below
+            max_vertex = int(edge_array.max())
+            if max_vertex >= np.iinfo(scotch_dtype).max:
+                raise ValueError(
+                    f"Edge contains vertex {max_vertex}, which does not fit in the "
+                    f"Scotch integer type ({np.dtype(scotch_dtype).name})"
+                )
+            edge_array = edge_array.astype(scotch_dtype)
+
+        # Symmetrize: edge k contributes the arcs (u, v) and (v, u), interleaved
+        # so that, once grouped by source vertex, each adjacency list keeps the
+        # order of the input edges. Self-loops contribute a single arc.
+        src = edge_array.ravel()
+        dst = edge_array[:, ::-1].ravel()
+        loops = edge_array[:, 0] == edge_array[:, 1]
+        keep = None
+        if loops.any():
+            # Rare: only then pay for the mask and the compacting copies
+            keep = np.ones(len(src), dtype=bool)
+            keep[1::2] = ~loops
+            src = src[keep]
+            dst = dst[keep]
+
+        # Every endpoint appears as an arc source, so when num_vertices is
+        # auto-detected the degree count doubles as the max-vertex scan.
+        if num_vertices is None:
+            degrees = np.bincount(src)
+            num_vertices = len(degrees)
+        else:
+            # Check first, so that a stray huge index fails fast instead of
+            # sizing the degree count
+            max_vertex = int(src.max())
+            if max_vertex >= num_vertices:
+                raise ValueError(
+                    f"Edge contains vertex {max_vertex} but num_vertices is {num_vertices}"
+                )
+            degrees = np.bincount(src, minlength=num_vertices)
+
         # Validate weights if provided
         if vertex_weights is not None and len(vertex_weights) != num_vertices:
             raise ValueError(
                 f"vertex_weights length ({len(vertex_weights)}) must match "
                 f"num_vertices ({num_vertices})"
             )
+        if edge_weights is not None and len(edge_weights) != len(edge_array):
+            raise ValueError(
+                f"edge_weights length ({len(edge_weights)}) must match "
+                f"number of edges ({len(edge_array)})"
+            )
 
-        # Build adjacency structure
-        adj = [[] for _ in range(num_vertices)]
-        for i, (u, v) in enumerate(edges):
-            adj[u].append(v)
-            if u != v:  # Avoid duplicate for self-loops
-                adj[v].append(u)
-
-        # Create verttab and edgetab using the correct dtype for the loaded Scotch variant
-        scotch_dtype = lib.get_scotch_dtype()
-        verttab = np.zeros(num_vertices + 1, dtype=scotch_dtype)
-        edge_count = 0
-        for i, neighbors in enumerate(adj):
-            verttab[i] = edge_count
-            edge_count += len(neighbors)
-        verttab[num_vertices] = edge_count
-
-        edgetab = np.zeros(edge_count, dtype=scotch_dtype)
-        idx = 0
-        for neighbors in adj:
-            for n in neighbors:
-                edgetab[idx] = n
-                idx += 1
+        # CSR: a stable sort by source vertex groups the arcs per vertex
+        # Gathers write straight into the final aligned arrays (no temporaries)
+        arc_order = _bucket_order(src, num_vertices)
+        edgetab = _aligned_empty(len(arc_order), scotch_dtype)
+        np.take(dst, arc_order, out=edgetab)
+        verttab = _aligned_empty(num_vertices + 1, scotch_dtype)
+        verttab[0] = 0
+        np.cumsum(degrees, out=verttab[1:])
+
+        edlotab_np = None
+        if edge_weights is not None:
+            # Each arc carries the weight of the edge it came from: interleaved
+            # arc k belongs to edge k // 2
+            arc_source = arc_order if keep is None else np.flatnonzero(keep)[arc_order]
+            edlotab_np = _aligned_empty(len(arc_order), scotch_dtype)
+            np.take(np.asarray(edge_weights, dtype=scotch_dtype), arc_source >> 1, out=edlotab_np)
 
         # Create graph
         graph = Graph()
 
-        velotab_np = np.array(vertex_weights, dtype=scotch_dtype) if vertex_weights else None
-        edlotab_np = np.array(edge_weights, dtype=scotch_dtype) if edge_weights else None
+        velotab_np = (
+            np.array(vertex_weights, dtype=scotch_dtype) if vertex_weights is not None else None
+        )
 
-        graph.build(verttab, edgetab, velotab_np, edlotab_np, baseval=0)
+        # The arrays were just built in the Scotch dtype: skip build()'s copies
+        graph._build_raw(verttab, edgetab, velotab_np, edlotab_np, baseval=0)
 
         return graph
 
     @internal_api
-    def _csr_arrays(self) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    def _graph_data(self):
         """
-        Extract the graph adjacency as normalized (0-based, compact) CSR arrays.
-
-        Uses SCOTCH_graphData to access Scotch's internal arrays and copies
-        them into fresh numpy arrays, re-basing indices to 0 and compacting
-        the edge array if the internal representation is not compact.
+        Return Scotch's internal graph arrays via SCOTCH_graphData.
 
         Returns:
-            Tuple of (indptr, indices, edlotab) where edlotab is None when
-            the graph carries no edge loads. indptr has vertnbr + 1 entries;
-            indices and edlotab have one entry per arc (each undirected edge
-            appears twice, once per direction).
+            Tuple of (baseval, vertnbr, verttab_p, vendtab_p, velotab_p,
+            edgetab_p, edlotab_p): ints, then ctypes pointers into Scotch
+            memory (NULL for absent load arrays), valid while the graph lives.
         """
-        scotch_dtype = lib.get_scotch_dtype()
-
         baseval = lib.SCOTCH_Num()
         vertnbr = lib.SCOTCH_Num()
         edgenbr = lib.SCOTCH_Num()
-        verttab_p = POINTER(lib.SCOTCH_Num)()
-        vendtab_p = POINTER(lib.SCOTCH_Num)()
-        velotab_p = POINTER(lib.SCOTCH_Num)()
-        vlbltab_p = POINTER(lib.SCOTCH_Num)()
-        edgetab_p = POINTER(lib.SCOTCH_Num)()
-        edlotab_p = POINTER(lib.SCOTCH_Num)()
+        verttab_p = lib.SCOTCH_NumPtr()
+        vendtab_p = lib.SCOTCH_NumPtr()
+        velotab_p = lib.SCOTCH_NumPtr()
+        vlbltab_p = lib.SCOTCH_NumPtr()
+        edgetab_p = lib.SCOTCH_NumPtr()
+        edlotab_p = lib.SCOTCH_NumPtr()
 
         lib.SCOTCH_graphData(
-            byref(self._graph),
+            self._graph,
             byref(baseval),
             byref(vertnbr),
             byref(verttab_p),
@@ -1250,9 +2158,34 @@ class Graph:
             byref(edgetab_p),
             byref(edlotab_p),
         )
+        return (
+            baseval.value,
+            vertnbr.value,
+            verttab_p,
+            vendtab_p,
+            velotab_p,
+            edgetab_p,
+            edlotab_p,
+        )
+
+    @internal_api
+    def _csr_arrays(self) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """
+        Extract the graph adjacency as normalized (0-based, compact) CSR arrays.
+
+        Uses SCOTCH_graphData to access Scotch's internal arrays and copies
+        them into fresh numpy arrays, re-basing indices to 0 and compacting
+        the edge array if the internal representation is not compact.
+
+        Returns:
+            Tuple of (indptr, indices, edlotab) where edlotab is None when
+            the graph carries no edge loads. indptr has vertnbr + 1 entries;
+            indices and edlotab have one entry per arc (each undirected edge
+            appears twice, once per direction).
+        """
+        scotch_dtype = _SCOTCH_DTYPE
 
-        base = baseval.value
-        n = vertnbr.value
+        base, n, verttab_p, vendtab_p, _, edgetab_p, edlotab_p = self._graph_data()
         if n <= 0:
             return (np.zeros(1, dtype=scotch_dtype), np.zeros(0, dtype=scotch_dtype), None)
 
@@ -1338,7 +2271,8 @@ class Graph:
 
         if not sparse.issparse(matrix):
             raise TypeError(
-                f"from_scipy_sparse expects a scipy sparse matrix/array, got {type(matrix).__name__}. "
+                "from_scipy_sparse expects a scipy sparse matrix/array, "
+                f"got {type(matrix).__name__}. "
                 "For dense arrays, wrap them first, e.g. scipy.sparse.csr_array(dense)"
             )
         nrow, ncol = matrix.shape
@@ -1390,7 +2324,7 @@ class Graph:
             else None
         )
 
-        scotch_dtype = lib.get_scotch_dtype()
+        scotch_dtype = _SCOTCH_DTYPE
         graph = cls()
         graph.build(
             A.indptr.astype(scotch_dtype),
@@ -1522,7 +2456,7 @@ class Graph:
         if use_weights:
             edlotab = _coerce_edge_weights(loads, what=f"edge weights (attribute {weight!r})")
 
-        scotch_dtype = lib.get_scotch_dtype()
+        scotch_dtype = _SCOTCH_DTYPE
         graph = cls()
         graph.build(
             np.asarray(indptr, dtype=scotch_dtype),
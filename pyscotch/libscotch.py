@@ -7,12 +7,24 @@ This module loads ONE Scotch variant based on environment variables:
 - PYSCOTCH_PARALLEL: 0 or 1 (default: 0)
 
 To test all variants, run the test suite 4 times with different configurations.
+
+Why ctypes (and not a compiled Cython/cffi extension):
+The variant (32/64-bit, sequential/parallel, bundled/system Scotch) is chosen
+at import time, from the environment, against whichever library is found.
+A compiled extension would pin one scotch.h at build time and require a C
+toolchain to install. The compute entry points run for milliseconds to
+minutes and CDLL already releases the GIL around them, so the microsecond
+ctypes trampoline only matters for tiny accessors (SCOTCH_graphSize, ...);
+those are kept off hot paths by caching on the Python side instead. The
+graph build/partition/order entry points additionally have address-taking
+bindings (raw_function) that skip most of the argument marshalling.
 """
 
 import ctypes
 import ctypes.util
+import functools
+import logging
 import os
-import sys
 
 import numpy as np
 from ctypes import c_int, c_long, c_double, c_char_p, c_void_p, POINTER, Structure, byref
@@ -21,6 +33,10 @@ from typing import Optional
 
 from .api_decorators import internal_api
 
+# Load diagnostics (library paths, structure sizes) are logged at DEBUG level:
+# enable with logging.getLogger("pyscotch.libscotch").setLevel(logging.DEBUG)
+_log = logging.getLogger(__name__)
+
 # =============================================================================
 # Configuration from Environment
 # =============================================================================
@@ -58,10 +74,19 @@ SCOTCH_Num = c_long if _INT_SIZE == 64 else c_int
 SCOTCH_Idx = c_long if _INT_SIZE == 64 else c_int
 SCOTCH_GraphPart2 = ctypes.c_ubyte
 
+# The integer width is fixed for the process, so the derived types are frozen
+# here once instead of being rebuilt by every caller
+SCOTCH_NumPtr = POINTER(SCOTCH_Num)
+_NP_DTYPE = np.int64 if _INT_SIZE == 64 else np.int32
+
 # =============================================================================
 # Library Loading
 # =============================================================================
 
+# Installed package directory; the bundled and development library dirs sit
+# at fixed places relative to it (see _get_lib_dir)
+_PACKAGE_DIR = Path(__file__).parent
+
 
 def _get_lib_dir() -> Optional[Path]:
     """Get the library directory for the current configuration.
@@ -86,28 +111,69 @@ def _get_lib_dir() -> Optional[Path]:
     managed = managed_lib_dir(_INT_SIZE, _PARALLEL)
     if managed is not None:
         return managed
-    packaged_dir = Path(__file__).parent / "_libs" / f"lib{_INT_SIZE}"
+    packaged_dir = _PACKAGE_DIR / "_libs" / f"lib{_INT_SIZE}"
     if packaged_dir.exists():
         return packaged_dir
-    builds_dir = Path(__file__).parent.parent / "scotch-builds" / f"lib{_INT_SIZE}"
+    builds_dir = _PACKAGE_DIR.parent / "scotch-builds" / f"lib{_INT_SIZE}"
     if builds_dir.exists():
         return builds_dir
     return None
 
 
-def _dlopen_system(short_name, sonames):
+# CDLL handles by resolved path (or bare soname). dlopen itself dedupes, but
+# each ctypes.CDLL call still goes through the loader's search and builds a
+# fresh wrapper with an empty function cache; the compat shim in particular is
+# opened both here and by graph.c_fopen.
+_CDLL_CACHE = {}
+
+
+def _get_cdll(name, mode=ctypes.RTLD_GLOBAL):
+    """Return the (cached) ctypes.CDLL for a library path or soname.
+
+    Paths are resolved with os.path.realpath so symlinked names share one
+    handle. ``mode`` only applies to the first load of a library.
+
+    Raises:
+        OSError: If the library cannot be loaded
+    """
+    name = os.fspath(name)
+    key = os.path.realpath(name) if os.sep in name else name
+    handle = _CDLL_CACHE.get(key)
+    if handle is None:
+        handle = ctypes.CDLL(key, mode=mode)
+        _CDLL_CACHE[key] = handle
+    return handle
+
+
+@functools.lru_cache(maxsize=None)
+def _find_library(short_name):
+    """ctypes.util.find_library, memoized.
+
+    On Linux every uncached call spawns ldconfig (and possibly gcc/ld)
+    subprocesses; the answer cannot change within a process.
+    """
+    return ctypes.util.find_library(short_name)
+
+
+def _dlopen_system(short_name, sonames, mode=ctypes.RTLD_GLOBAL):
     """Load a library from the system linker paths, or return None.
 
-    Tries ctypes.util.find_library first (ldconfig cache), then dlopen on a
-    list of candidate sonames (which also honors LD_LIBRARY_PATH).
+    Tries dlopen on a list of candidate sonames first: the loader searches
+    LD_LIBRARY_PATH, the ldconfig cache and the default dirs in-process.
+    ctypes.util.find_library, which spawns ldconfig/gcc subprocesses, is only
+    consulted when none of them loads, to catch an unlisted soname.
     """
-    found = ctypes.util.find_library(short_name)
-    candidates = ([found] if found else []) + list(sonames)
-    for name in candidates:
+    for name in sonames:
         try:
-            return ctypes.CDLL(name, mode=ctypes.RTLD_GLOBAL)
+            return _get_cdll(name, mode)
         except OSError:
             continue
+    found = _find_library(short_name)
+    if found and found not in sonames:
+        try:
+            return _get_cdll(found, mode)
+        except OSError:
+            pass
     return None
 
 
@@ -136,19 +202,57 @@ def _dlopen_system(short_name, sonames):
 _ZLIB_SONAMES = ["libz.so.1", "libz.so", "libz.1.dylib", "libz.dylib"]
 _MPI_SONAMES = ["libmpi.so", "libmpi.so.40", "libmpi.so.12", "libmpi.dylib"]
 
+# Sonames tried for a system-installed Scotch (see _load_system_libraries)
+_COMPAT_SONAMES = ["libpyscotch_compat.so"]
+_SCOTCHERR_SONAMES = ["libscotcherr.so", "libscotcherr.so.7", "libscotcherr-7.0.so"]
+_SCOTCH_SONAMES = ["libscotch.so", "libscotch.so.7", "libscotch-7.0.so"]
+_PTSCOTCH_SONAMES = ["libptscotch.so", "libptscotch.so.7", "libptscotch-7.0.so"]
+
+
+def _promote_loaded(sonames):
+    """Return a handle to the first of ``sonames`` already in the process.
+
+    dlopen with RTLD_NOLOAD never loads anything: it only succeeds for a
+    library that is already mapped (zlib is, whenever Python's zlib module or
+    numpy got there first), and with RTLD_GLOBAL it promotes that copy into
+    the global namespace Scotch resolves against. That skips the
+    find_library subprocesses and any search of the loader path. Returns
+    None when none is loaded or the platform lacks RTLD_NOLOAD.
+    """
+    noload = getattr(os, "RTLD_NOLOAD", None)
+    if noload is None:
+        return None
+    for soname in sonames:
+        try:
+            return _get_cdll(soname, ctypes.RTLD_GLOBAL | noload)
+        except OSError:
+            continue
+    return None
+
 
 def _preload_dependencies():
     """Preload under-declared shared dependencies (zlib, and MPI when parallel)
     RTLD_GLOBAL, before Scotch loads, so its calls resolve even under eager
     binding (-z now, the manylinux default). See the module comment above for
     why this is needed and why it is one of two independent layers of defense.
-    Reuses _dlopen_system's find_library-then-soname search; a miss is a no-op
-    (the library may already be global, or the bundled .so's NEEDED covers it)."""
-    _dlopen_system("z", _ZLIB_SONAMES)
-    if _PARALLEL:
+    A copy already in the process is promoted in place (_promote_loaded);
+    otherwise this reuses _dlopen_system's soname-then-find_library search. A
+    miss is a no-op (the bundled .so's NEEDED entries may cover it)."""
+    if _promote_loaded(_ZLIB_SONAMES) is None:
+        _dlopen_system("z", _ZLIB_SONAMES)
+    if _PARALLEL and _promote_loaded(_MPI_SONAMES) is None:
         _dlopen_system("mpi", _MPI_SONAMES)
 
 
+# Mode libscotch.so itself is opened with. Its dependencies (zlib, MPI, the
+# compat shim, libscotcherr) must stay RTLD_GLOBAL: Scotch resolves them from
+# the global scope (see above). libscotch's own symbols only need to be global
+# when libptscotch.so is loaded on top of it. Otherwise they stay local, which
+# keeps Scotch's thousands of symbols out of the global lookup scope and away
+# from other Scotch copies (e.g. one linked into PETSc or MUMPS).
+_SCOTCH_DLOPEN_MODE = ctypes.RTLD_GLOBAL if _PARALLEL else ctypes.RTLD_LOCAL
+
+
 def _load_system_libraries():
     """Load Scotch from the system linker paths (distro/conda packages).
 
@@ -160,13 +264,13 @@ def _load_system_libraries():
     # — before libscotcherr — so Scotch's unsuffixed SCOTCH_errorPrint binds to
     # the capturing shim instead of the stderr printer. Absent shim: no-op, and
     # messages go to stderr as before.
-    compat = _dlopen_system("pyscotch_compat", ["libpyscotch_compat.so"])
+    compat = _dlopen_system("pyscotch_compat", _COMPAT_SONAMES)
     if compat is not None:
         _wire_err_capture(compat)
 
-    _dlopen_system("scotcherr", ["libscotcherr.so", "libscotcherr.so.7", "libscotcherr-7.0.so"])
+    _dlopen_system("scotcherr", _SCOTCHERR_SONAMES)
 
-    seq = _dlopen_system("scotch", ["libscotch.so", "libscotch.so.7", "libscotch-7.0.so"])
+    seq = _dlopen_system("scotch", _SCOTCH_SONAMES, _SCOTCH_DLOPEN_MODE)
     if seq is None:
         from .scotch_build import latest_version
 
@@ -180,20 +284,18 @@ def _load_system_libraries():
             "  - set PYSCOTCH_LIB_DIR to a directory containing libscotch.so,\n"
             "  - or run 'make build-all' in a PyScotch checkout."
         )
-    print(f"✓ Loaded system Scotch ({_INT_SIZE}-bit requested)", file=sys.stderr)
+    _log.debug("Loaded system Scotch (%s-bit requested)", _INT_SIZE)
 
     par = None
     if _PARALLEL:
-        par = _dlopen_system(
-            "ptscotch", ["libptscotch.so", "libptscotch.so.7", "libptscotch-7.0.so"]
-        )
+        par = _dlopen_system("ptscotch", _PTSCOTCH_SONAMES)
         if par is None:
             raise FileNotFoundError(
                 "No system PT-Scotch library found (PYSCOTCH_PARALLEL=1). "
                 "Install it (e.g. 'apt install libptscotch-dev') or set "
                 "PYSCOTCH_PARALLEL=0."
             )
-        print("✓ Loaded system PT-Scotch", file=sys.stderr)
+        _log.debug("Loaded system PT-Scotch")
 
     return seq, par
 
@@ -221,14 +323,15 @@ def _wire_err_capture(handle):
         pass  # older shim without error capture: keep stderr behavior
 
 
-def _load_error_capture(lib_dir):
+def _load_error_capture(lib_dir, present):
     """Load the compat shim from a known lib dir (bundled / PYSCOTCH_LIB_DIR)
-    FIRST and globally, before any Scotch library binds SCOTCH_errorPrint."""
-    compat_path = lib_dir / "libpyscotch_compat.so"
-    if not compat_path.exists():
+    FIRST and globally, before any Scotch library binds SCOTCH_errorPrint.
+    ``present`` is the set of file names in lib_dir."""
+    if "libpyscotch_compat.so" not in present:
         return
+    compat_path = os.path.join(lib_dir, "libpyscotch_compat.so")
     try:
-        handle = ctypes.CDLL(str(compat_path), mode=ctypes.RTLD_GLOBAL)
+        handle = _get_cdll(compat_path)
     except OSError:
         return
     _wire_err_capture(handle)
@@ -259,54 +362,71 @@ def scotch_error(context: str, ret=None) -> RuntimeError:
     return RuntimeError(message)
 
 
-def _load_libraries():
-    """Load the Scotch libraries."""
-    lib_dir = _get_lib_dir()
+# Scotch libraries are always opened with ctypes.CDLL, never ctypes.PyDLL:
+# CDLL releases the GIL for the duration of every foreign call, so long-running
+# entry points (SCOTCH_graphMapCompute, SCOTCH_graphOrder, ...) do not block
+# other Python threads, and distinct graphs can be partitioned concurrently
+# from a thread pool. PyDLL would hold the GIL and serialize them.
+
 
+def _load_libraries(lib_dir: Optional[Path]):
+    """Load the Scotch libraries from lib_dir (None: system Scotch)."""
     if lib_dir is None:
         return _load_system_libraries()
 
+    # One directory listing answers every presence check below, instead of a
+    # stat() per candidate file. A missing directory lists as empty, so the
+    # libscotch.so check reports it.
+    try:
+        with os.scandir(lib_dir) as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        present = set()
+
     # Error capture must be in the global symbol table before any Scotch
     # library binds SCOTCH_errorPrint
-    _load_error_capture(lib_dir)
+    _load_error_capture(lib_dir, present)
 
     # Load error library
-    err_lib_path = lib_dir / "libscotcherr.so"
-    if err_lib_path.exists():
+    err_lib_path = os.path.join(lib_dir, "libscotcherr.so")
+    if "libscotcherr.so" in present:
         try:
-            ctypes.CDLL(str(err_lib_path), mode=ctypes.RTLD_GLOBAL)
+            _get_cdll(err_lib_path)
         except OSError as e:
-            print(f"Warning: Could not load {err_lib_path}: {e}", file=sys.stderr)
+            _log.warning("Could not load %s: %s", err_lib_path, e)
 
     # Load sequential library (always needed)
-    seq_lib_path = lib_dir / "libscotch.so"
-    if not seq_lib_path.exists():
+    seq_lib_path = os.path.join(lib_dir, "libscotch.so")
+    if "libscotch.so" not in present:
         raise FileNotFoundError(f"Sequential library not found: {seq_lib_path}")
 
-    _lib_sequential = ctypes.CDLL(str(seq_lib_path), mode=ctypes.RTLD_GLOBAL)
-    print(f"✓ Loaded Scotch: {_INT_SIZE}-bit from {seq_lib_path}", file=sys.stderr)
+    _lib_sequential = _get_cdll(seq_lib_path, _SCOTCH_DLOPEN_MODE)
+    _log.debug("Loaded Scotch: %s-bit from %s", _INT_SIZE, seq_lib_path)
 
     # Load parallel library if needed
     _lib_parallel = None
     if _PARALLEL:
-        par_lib_path = lib_dir / "libptscotch.so"
-        if not par_lib_path.exists():
+        par_lib_path = os.path.join(lib_dir, "libptscotch.so")
+        if "libptscotch.so" not in present:
             raise FileNotFoundError(f"Parallel library not found: {par_lib_path}")
 
-        _lib_parallel = ctypes.CDLL(str(par_lib_path), mode=ctypes.RTLD_GLOBAL)
-        print(f"✓ Loaded PT-Scotch: {_INT_SIZE}-bit from {par_lib_path}", file=sys.stderr)
+        _lib_parallel = _get_cdll(par_lib_path)
+        _log.debug("Loaded PT-Scotch: %s-bit from %s", _INT_SIZE, par_lib_path)
 
     return _lib_sequential, _lib_parallel
 
 
-# Preload dependencies and load libraries
-_preload_dependencies()
-_lib_sequential, _lib_parallel = _load_libraries()
-
-# Directory the libraries were loaded from (also used by graph.c_fopen to
+# Directory the libraries are loaded from (also used by graph.c_fopen to
 # locate libpyscotch_compat.so built with the same toolchain).
 # None means system-installed Scotch (c_fopen then uses the platform libc).
+# Discovered once: the lookup reads the build store, and a second lookup
+# could disagree with the libraries actually loaded.
 _loaded_lib_dir = _get_lib_dir()
+
+# Preload dependencies and load libraries
+_preload_dependencies()
+_lib_sequential, _lib_parallel = _load_libraries(_loaded_lib_dir)
+
 _lib_dir = str(_loaded_lib_dir) if _loaded_lib_dir is not None else None
 
 # =============================================================================
@@ -315,10 +435,23 @@ _lib_dir = str(_loaded_lib_dir) if _loaded_lib_dir is not None else None
 
 
 def _make_opaque_struct(name: str, size: int):
-    """Create an opaque ctypes Structure class with given size."""
+    """Create an opaque ctypes Structure class with given size.
+
+    scotch.h declares these types as ``struct { double dummy[N]; }``, so the
+    C side assumes double alignment and the size is a multiple of 8. The
+    payload is one 8-byte-element array, which gives the ctypes type that
+    alignment (a bare c_byte array is only byte-aligned) and keeps instances
+    embedded in arrays or other Structures off split cache lines. A size
+    that is not a multiple of 8 keeps a byte payload behind a zero-length
+    c_double field, which aligns it the same way without changing its size.
+    """
+    if size % 8 == 0:
+        fields = [("_opaque", ctypes.c_uint64 * (size // 8))]
+    else:
+        fields = [("_align", ctypes.c_double * 0), ("_opaque", ctypes.c_byte * size)]
 
     class OpaqueStruct(Structure):
-        _fields_ = [("_opaque", ctypes.c_byte * size)]
+        _fields_ = fields
 
     OpaqueStruct.__name__ = name
     OpaqueStruct.__qualname__ = name
@@ -372,8 +505,27 @@ def _detect_suffix() -> str:
 _PARALLEL_FUNC_PREFIXES = ("scotch_dgraph", "scotch_stratdgraph", "scotch_dmap", "scotch_dorder")
 
 
+# Resolved Scotch functions by unsuffixed name (see _get_func)
+_FUNC_CACHE = {}
+# Names the loaded libraries do not export, so repeated probes (_has_func,
+# _MISSING_BINDINGS, optional-feature checks) skip the failing dlsym
+_MISSING_FUNCS = set()
+
+
 def _get_func(name: str):
-    """Get a Scotch function with the correct suffix."""
+    """Get a Scotch function with the correct suffix.
+
+    Symbols are looked up with CDLL.__getitem__ (a plain dlsym, without the
+    attribute machinery of CDLL.__getattr__) and memoized in _FUNC_CACHE, so
+    each name is resolved once and always maps to the same function object,
+    which is what its declared signature is applied to. Missing names are
+    remembered too, in _MISSING_FUNCS.
+    """
+    func = _FUNC_CACHE.get(name)
+    if func is not None:
+        return func
+    if name in _MISSING_FUNCS:
+        raise AttributeError(f"{name}{_SUFFIX} not found in the loaded Scotch library")
     # PT-Scotch functions are in the parallel library
     if name.lower().startswith(_PARALLEL_FUNC_PREFIXES):
         if not _lib_parallel:
@@ -387,11 +539,14 @@ def _get_func(name: str):
         handle = _lib_sequential
 
     try:
-        return getattr(handle, f"{name}{_SUFFIX}")
+        func = handle[f"{name}{_SUFFIX}"]
     except AttributeError:
-        if name in _UNSUFFIXED_FUNCTIONS:
-            return getattr(handle, name)
-        raise
+        if name not in _UNSUFFIXED_FUNCTIONS:
+            _MISSING_FUNCS.add(name)
+            raise
+        func = handle[name]
+    _FUNC_CACHE[name] = func
+    return func
 
 
 # Symbol suffix: "_32"/"_64" for PyScotch's own builds, "" for system or
@@ -476,10 +631,12 @@ else:
     SCOTCH_Dmapping = None
     SCOTCH_Dordering = None
 
-print(
-    f"✓ Structure sizes: graph={_SIZES['graph']}, strat={_SIZES['strat']}, "
-    f"arch={_SIZES['arch']}, dgraph={_SIZES['dgraph']}",
-    file=sys.stderr,
+_log.debug(
+    "Structure sizes: graph=%s, strat=%s, arch=%s, dgraph=%s",
+    _SIZES["graph"],
+    _SIZES["strat"],
+    _SIZES["arch"],
+    _SIZES["dgraph"],
 )
 
 # =============================================================================
@@ -487,8 +644,14 @@ print(
 # =============================================================================
 
 
-def _bind_functions():
-    """Bind all Scotch functions with proper type signatures."""
+def _declare_bindings():
+    """
+    Return the type signatures of the Scotch functions, keyed by C name.
+
+    Only the table is built here; symbols are resolved and configured on
+    first access (see _bound_func), so functions a program never calls cost
+    no dlsym lookup and no ctypes setup at import.
+    """
     # Get structure pointer types
     GraphPtr = POINTER(SCOTCH_Graph)
     MeshPtr = POINTER(SCOTCH_Mesh)
@@ -498,8 +661,15 @@ def _bind_functions():
     ContextPtr = POINTER(SCOTCH_Context)
     OrderingPtr = POINTER(SCOTCH_Ordering)
     GeomPtr = POINTER(SCOTCH_Geom)
-    NumPtr = POINTER(SCOTCH_Num)
+    NumPtr = SCOTCH_NumPtr
     IdxPtr = POINTER(SCOTCH_Idx)
+    # Pointer types for output/statistics parameters, built once here rather
+    # than at each signature that uses them
+    NumPtrPtr = POINTER(NumPtr)
+    IntPtr = POINTER(c_int)
+    DoublePtr = POINTER(c_double)
+    DoublePtrPtr = POINTER(DoublePtr)
+    GraphPart2Ptr = POINTER(SCOTCH_GraphPart2)
 
     bindings = {}
 
@@ -529,13 +699,13 @@ def _bind_functions():
             GraphPtr,
             NumPtr,
             NumPtr,
-            POINTER(NumPtr),
-            POINTER(NumPtr),
-            POINTER(NumPtr),
-            POINTER(NumPtr),
+            NumPtrPtr,
+            NumPtrPtr,
+            NumPtrPtr,
+            NumPtrPtr,
             NumPtr,
-            POINTER(NumPtr),
-            POINTER(NumPtr),
+            NumPtrPtr,
+            NumPtrPtr,
         ],
     )
     bindings["SCOTCH_graphLoad"] = (c_int, [GraphPtr, c_void_p, SCOTCH_Num, SCOTCH_Num])
@@ -557,7 +727,7 @@ def _bind_functions():
     bindings["SCOTCH_graphInduceList"] = (c_int, [GraphPtr, SCOTCH_Num, NumPtr, GraphPtr])
     bindings["SCOTCH_graphInducePart"] = (
         c_int,
-        [GraphPtr, SCOTCH_Num, POINTER(SCOTCH_GraphPart2), SCOTCH_GraphPart2, GraphPtr],
+        [GraphPtr, SCOTCH_Num, GraphPart2Ptr, SCOTCH_GraphPart2, GraphPtr],
     )
     bindings["SCOTCH_graphDiamPV"] = (SCOTCH_Num, [GraphPtr])
     bindings["SCOTCH_graphColor"] = (c_int, [GraphPtr, NumPtr, NumPtr, SCOTCH_Num])
@@ -568,17 +738,17 @@ def _bind_functions():
             NumPtr,
             NumPtr,
             NumPtr,
-            POINTER(c_double),
-            POINTER(c_double),
+            DoublePtr,
+            DoublePtr,
             NumPtr,
             NumPtr,
-            POINTER(c_double),
-            POINTER(c_double),
+            DoublePtr,
+            DoublePtr,
             NumPtr,
             NumPtr,
             NumPtr,
-            POINTER(c_double),
-            POINTER(c_double),
+            DoublePtr,
+            DoublePtr,
         ],
     )
     bindings["SCOTCH_graphMap"] = (c_int, [GraphPtr, ArchPtr, StratPtr, NumPtr])
@@ -750,13 +920,13 @@ def _bind_functions():
             NumPtr,
             NumPtr,
             NumPtr,
-            POINTER(NumPtr),
-            POINTER(NumPtr),
-            POINTER(NumPtr),
-            POINTER(NumPtr),
-            POINTER(NumPtr),
+            NumPtrPtr,
+            NumPtrPtr,
+            NumPtrPtr,
+            NumPtrPtr,
+            NumPtrPtr,
             NumPtr,
-            POINTER(NumPtr),
+            NumPtrPtr,
             NumPtr,
         ],
     )
@@ -769,16 +939,16 @@ def _bind_functions():
             NumPtr,
             NumPtr,
             NumPtr,
-            POINTER(c_double),
-            POINTER(c_double),
+            DoublePtr,
+            DoublePtr,
             NumPtr,
             NumPtr,
-            POINTER(c_double),
-            POINTER(c_double),
+            DoublePtr,
+            DoublePtr,
             NumPtr,
             NumPtr,
-            POINTER(c_double),
-            POINTER(c_double),
+            DoublePtr,
+            DoublePtr,
         ],
     )
     bindings["SCOTCH_meshOrder"] = (
@@ -799,7 +969,7 @@ def _bind_functions():
     # --- Geometry functions ---
     bindings["SCOTCH_geomInit"] = (c_int, [GeomPtr])
     bindings["SCOTCH_geomExit"] = (None, [GeomPtr])
-    bindings["SCOTCH_geomData"] = (None, [GeomPtr, NumPtr, POINTER(POINTER(c_double))])
+    bindings["SCOTCH_geomData"] = (None, [GeomPtr, NumPtr, DoublePtrPtr])
 
     # --- Random functions ---
     bindings["SCOTCH_randomReset"] = (None, [])
@@ -827,17 +997,7 @@ def _bind_functions():
 
     # --- Version function ---
     # Takes plain int*, not SCOTCH_Num*
-    bindings["SCOTCH_version"] = (None, [POINTER(c_int), POINTER(c_int), POINTER(c_int)])
-
-    # Apply bindings
-    missing = []
-    for name, (restype, argtypes) in bindings.items():
-        try:
-            func = _get_func(name)
-            func.restype = restype
-            func.argtypes = argtypes
-        except AttributeError:
-            missing.append(name)  # Function may not exist in all versions
+    bindings["SCOTCH_version"] = (None, [IntPtr, IntPtr, IntPtr])
 
     # --- Dgraph functions (parallel only) ---
     if _lib_parallel:
@@ -874,16 +1034,16 @@ def _bind_functions():
                     NumPtr,
                     NumPtr,
                     NumPtr,  # baseval, vertglbnbr, vertlocnbr, vertlocmax, vertgstnbr
-                    POINTER(NumPtr),
-                    POINTER(NumPtr),
-                    POINTER(NumPtr),
-                    POINTER(NumPtr),  # vertloctab, vendloctab, veloloctab, vlblloctab
+                    NumPtrPtr,
+                    NumPtrPtr,
+                    NumPtrPtr,
+                    NumPtrPtr,  # vertloctab, vendloctab, veloloctab, vlblloctab
                     NumPtr,
                     NumPtr,
                     NumPtr,  # edgeglbnbr, edgelocnbr, edgelocsiz
-                    POINTER(NumPtr),
-                    POINTER(NumPtr),
-                    POINTER(NumPtr),  # edgeloctab, edgegsttab, edloloctab
+                    NumPtrPtr,
+                    NumPtrPtr,
+                    NumPtrPtr,  # edgeloctab, edgegsttab, edloloctab
                     c_void_p,  # MPI_Comm*
                 ],
             ),
@@ -917,17 +1077,17 @@ def _bind_functions():
                     NumPtr,
                     NumPtr,
                     NumPtr,  # velomin, velomax, velosum
-                    POINTER(c_double),
-                    POINTER(c_double),  # veloavg, velodlt
+                    DoublePtr,
+                    DoublePtr,  # veloavg, velodlt
                     NumPtr,
                     NumPtr,  # degrmin, degrmax
-                    POINTER(c_double),
-                    POINTER(c_double),  # degravg, degrdlt
+                    DoublePtr,
+                    DoublePtr,  # degravg, degrdlt
                     NumPtr,
                     NumPtr,
                     NumPtr,  # edlomin, edlomax, edlosum
-                    POINTER(c_double),
-                    POINTER(c_double),  # edloavg, edlodlt
+                    DoublePtr,
+                    DoublePtr,  # edloavg, edlodlt
                 ],
             ),
             # Centralized <-> distributed conversion (SCOTCH_Graph on root rank)
@@ -986,24 +1146,63 @@ def _bind_functions():
             "SCOTCH_dgraphOrderGather": (c_int, [DgraphPtr, DorderingPtr, OrderingPtr]),
         }
 
-        for name, (restype, argtypes) in dgraph_bindings.items():
-            try:
-                func = _get_func(name)
-                func.restype = restype
-                func.argtypes = argtypes
-            except AttributeError:
-                missing.append(name)
-
         bindings.update(dgraph_bindings)
 
-    return bindings, missing
+    return bindings
 
 
-# Bind all functions.
 # _DECLARED_BINDINGS maps C function name -> (restype, argtypes) as declared
-# above; _MISSING_BINDINGS lists declared functions absent from the loaded
-# libraries. Both are introspected by the signature-verification tests.
-_DECLARED_BINDINGS, _MISSING_BINDINGS = _bind_functions()
+# above. _MISSING_BINDINGS, the declared functions absent from the loaded
+# libraries, is computed on first access (module __getattr__). Both are
+# introspected by the signature-verification tests.
+_DECLARED_BINDINGS = _declare_bindings()
+
+
+# Functions that already carry their declared signature, by unsuffixed name.
+# Assigning argtypes rebuilds ctypes' converter tuple, so it is done once.
+_BOUND_FUNCS = {}
+
+# Constant-time accessors that never block. These are bound like PyDLL
+# functions, keeping the GIL across the call: releasing and re-acquiring it
+# costs more than the call itself. Everything else stays on CDLL semantics
+# (see the comment above _load_libraries), including cheap-looking calls that
+# walk the graph, such as SCOTCH_graphBase (O(V+E)).
+_GIL_HELD_FUNCTIONS = frozenset(
+    {
+        "SCOTCH_version",
+        "SCOTCH_randomVal",
+        "SCOTCH_memCur",
+        "SCOTCH_memMax",
+        "SCOTCH_archSize",
+    }
+)
+
+
+def _bound_func(name: str):
+    """Resolve a Scotch function and apply its declared signature (cached)."""
+    func = _BOUND_FUNCS.get(name)
+    if func is None:
+        func = _get_func(name)
+        signature = _DECLARED_BINDINGS.get(name)
+        if signature is not None:
+            restype, argtypes = signature
+            if name in _GIL_HELD_FUNCTIONS:
+                address = ctypes.cast(func, c_void_p).value
+                func = ctypes.PYFUNCTYPE(restype, *argtypes)(address)
+            else:
+                func.restype, func.argtypes = signature
+        _BOUND_FUNCS[name] = func
+    return func
+
+
+def _has_func(name: str) -> bool:
+    """Return True if the loaded libraries export Scotch function ``name``."""
+    try:
+        _get_func(name)
+    except AttributeError:
+        return False  # Function may not exist in all versions
+    return True
+
 
 # =============================================================================
 # Public API
@@ -1019,9 +1218,57 @@ def get_scotch_int_size() -> int:
 @internal_api
 def get_scotch_dtype():
     """Return the numpy dtype corresponding to SCOTCH_Num."""
-    import numpy as np
+    return _NP_DTYPE
+
+
+# Hot entry points re-bound with every pointer argument typed as c_void_p, so
+# callers pass plain integer addresses (ctypes.addressof, ndarray.ctypes.data).
+# Converting an int through c_void_p is several times cheaper than the
+# byref()/POINTER(...) marshalling of the regular bindings; this recovers most
+# of the per-call overhead a compiled extension would save, without one.
+_RAW_SIGNATURES = {
+    "SCOTCH_graphBuild": (
+        c_int,
+        [c_void_p, SCOTCH_Num, SCOTCH_Num] + [c_void_p] * 4 + [SCOTCH_Num, c_void_p, c_void_p],
+    ),
+    "SCOTCH_graphPart": (c_int, [c_void_p, SCOTCH_Num, c_void_p, c_void_p]),
+    "SCOTCH_graphOrder": (c_int, [c_void_p] * 7),
+    "SCOTCH_graphMapInit": (c_int, [c_void_p] * 4),
+    "SCOTCH_graphMapCompute": (c_int, [c_void_p] * 3),
+    "SCOTCH_graphMapExit": (None, [c_void_p] * 2),
+    "SCOTCH_graphInit": (c_int, [c_void_p]),
+    "SCOTCH_graphExit": (None, [c_void_p]),
+    "SCOTCH_graphFree": (None, [c_void_p]),
+    "SCOTCH_meshGraph": (c_int, [c_void_p] * 2),
+    "SCOTCH_meshOrder": (c_int, [c_void_p] * 7),
+    "SCOTCH_meshBuild": (
+        c_int,
+        [c_void_p] + [SCOTCH_Num] * 4 + [c_void_p] * 5 + [SCOTCH_Num, c_void_p],
+    ),
+}
+_RAW_FUNCTIONS = {}
+
 
-    return np.int32 if _INT_SIZE == 32 else np.int64
+@internal_api
+def raw_function(name: str):
+    """
+    Return the address-taking binding of a hot Scotch entry point.
+
+    Same C function as ``lib.<name>``, but every pointer parameter takes an
+    integer address (or None for NULL). The caller must keep the pointed-to
+    objects alive for the duration of the call. Like CDLL functions, these
+    release the GIL while Scotch runs.
+
+    Raises:
+        KeyError: If ``name`` has no raw binding (see _RAW_SIGNATURES)
+    """
+    func = _RAW_FUNCTIONS.get(name)
+    if func is None:
+        restype, argtypes = _RAW_SIGNATURES[name]
+        address = ctypes.cast(_get_func(name), c_void_p).value
+        func = ctypes.CFUNCTYPE(restype, *argtypes)(address)
+        _RAW_FUNCTIONS[name] = func
+    return func
 
 
 def to_scotch_array(array, copy=False):
@@ -1029,10 +1276,10 @@ def to_scotch_array(array, copy=False):
 
     The returned array must be kept alive for the pointer to remain valid.
     """
-    arr = np.asarray(array, dtype=get_scotch_dtype())
+    arr = np.asarray(array, dtype=_NP_DTYPE)
     if copy:
         arr = arr.copy()
-    return arr, arr.ctypes.data_as(POINTER(SCOTCH_Num))
+    return arr, arr.ctypes.data_as(SCOTCH_NumPtr)
 
 
 def to_scotch_array_optional(array):
@@ -1055,7 +1302,7 @@ def is_parallel() -> bool:
 def get_scotch_version() -> tuple:
     """Return the loaded Scotch version as a (major, minor, patch) int tuple."""
     major, minor, patch = c_int(), c_int(), c_int()
-    _get_func("SCOTCH_version")(byref(major), byref(minor), byref(patch))
+    _bound_func("SCOTCH_version")(byref(major), byref(minor), byref(patch))
     return (major.value, minor.value, patch.value)
 
 
@@ -1064,15 +1311,24 @@ def get_scotch_version() -> tuple:
 # =============================================================================
 
 
+# Bound SCOTCH_randomVal, resolved on the first _wrapped_randomVal call so a
+# library without it still imports
+_RANDOM_VAL = None
+
+
 def _wrapped_randomVal(randmax):
     """Wrapper for SCOTCH_randomVal with input validation.
 
     Validates that randmax > 0 to prevent floating-point exception
-    in the underlying C function (divide by zero).
+    in the underlying C function (divide by zero). The binding is kept in
+    _RANDOM_VAL after the first call, since this may be called in loops.
     """
+    global _RANDOM_VAL
     if randmax <= 0:
         raise ValueError(f"SCOTCH_randomVal requires randmax > 0, got {randmax}")
-    return _get_func("SCOTCH_randomVal")(randmax)
+    if _RANDOM_VAL is None:
+        _RANDOM_VAL = _bound_func("SCOTCH_randomVal")
+    return _RANDOM_VAL(randmax)
 
 
 # Registry of wrapped functions
@@ -1087,17 +1343,31 @@ _WRAPPED_FUNCTIONS = {
 
 
 def __getattr__(name: str):
-    """Provide attribute access for Scotch functions."""
+    """
+    Provide attribute access for Scotch functions.
+
+    Functions are resolved and given their declared signature on first
+    access. The result is stored in the module globals, so this hook only
+    runs once per name: later ``lib.SCOTCH_x`` lookups are plain module-dict
+    hits. The variant is fixed per process (see the module docstring), so
+    cached entries never need invalidating. _MISSING_BINDINGS is computed
+    the same way, since probing every declared symbol is only needed by the
+    signature tests.
+    """
     # Check for wrapped functions first
     if name in _WRAPPED_FUNCTIONS:
-        return _WRAPPED_FUNCTIONS[name]
-
-    if name.startswith("SCOTCH_"):
+        value = _WRAPPED_FUNCTIONS[name]
+    elif name == "_MISSING_BINDINGS":
+        value = [n for n in _DECLARED_BINDINGS if not _has_func(n)]
+    elif name.startswith("SCOTCH_"):
         try:
-            return _get_func(name)
+            value = _bound_func(name)
         except AttributeError:
             raise AttributeError(f"module 'libscotch' has no attribute '{name}'")
-    raise AttributeError(f"module 'libscotch' has no attribute '{name}'")
+    else:
+        raise AttributeError(f"module 'libscotch' has no attribute '{name}'")
+    globals()[name] = value
+    return value
 
 
 # =============================================================================
@@ -1116,6 +1386,7 @@ __all__ = [
     # Types
     "SCOTCH_Num",
     "SCOTCH_Idx",
+    "SCOTCH_NumPtr",
     "SCOTCH_GraphPart2",
     # Structures
     "SCOTCH_Graph",
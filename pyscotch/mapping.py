@@ -4,9 +4,10 @@ Mapping class for PT-Scotch mapping operations.
 
 import numpy as np
 from pathlib import Path
-from typing import Union
+from typing import List, Union
 
 from .api_decorators import internal_api
+from ._textio import _IO_BUFFER_SIZE, _read_int_tokens, _write_int_rows
 
 
 class Mapping:
@@ -15,6 +16,10 @@ class Mapping:
 
     A mapping assigns each vertex of a source graph to a domain of a target
     architecture, typically used for domain decomposition and load balancing.
+
+    Mappings are immutable: ``mapping`` is a read-only int64 array, so its
+    statistics can be cached. To change assignments, edit a copy and build a
+    new Mapping, e.g. ``Mapping(np.array(m.mapping))``.
     """
 
     def __init__(self, mapping_array: np.ndarray):
@@ -30,12 +35,28 @@ class Mapping:
         if len(mapping_array) == 0:
             raise ValueError("mapping_array cannot be empty")
 
-        self.mapping = np.asarray(mapping_array, dtype=np.int64)
+        # A private, read-only copy: the statistics cached below can never go
+        # stale through the caller's array or through views handed out later
+        mapping = np.array(mapping_array, dtype=np.int64)
+        mapping.setflags(write=False)
+        self._adopt(mapping)
+
+    def _adopt(self, mapping: np.ndarray) -> None:
+        """Validate a read-only int64 array and take it as this mapping."""
+        self.mapping = mapping
 
-        if np.any(self.mapping < 0):
+        # min() scans in place; np.any(mapping < 0) would first build an
+        # N-element boolean temporary
+        if self.mapping.min() < 0:
             raise ValueError("mapping_array cannot contain negative domain values")
 
         self.size = len(self.mapping)
+        # The array is immutable, so its largest domain and the partition
+        # sizes are computed at most once.
+        self._max_domain = int(self.mapping.max())
+        self._sizes = None
+        self._order = None
+        self._offsets = None
 
     @internal_api
     def save(self, filename: Union[str, Path]) -> None:
@@ -46,10 +67,9 @@ class Mapping:
             filename: Output file path
         """
         filename = Path(filename)
-        with open(filename, "w") as f:
+        with open(filename, "w", buffering=_IO_BUFFER_SIZE) as f:
             f.write(f"{self.size}\n")
-            for i, domain in enumerate(self.mapping):
-                f.write(f"{i}\t{domain}\n")
+            _write_int_rows(f, (np.arange(self.size), self.mapping))
 
     @staticmethod
     @internal_api
@@ -65,25 +85,76 @@ class Mapping:
 
         Raises:
             FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a well-formed mapping file
         """
         filename = Path(filename)
         if not filename.exists():
             raise FileNotFoundError(f"Mapping file not found: {filename}")
 
-        with open(filename, "r") as f:
-            lines = f.readlines()
-            size = int(lines[0].strip())
-            mapping = np.zeros(size, dtype=np.int64)
+        tokens = _read_int_tokens(filename)
+        if len(tokens) == 0 or len(tokens) % 2 != 1:
+            raise ValueError(f"{filename}: malformed mapping file")
 
-            for line in lines[1:]:
-                if line.strip():
-                    parts = line.strip().split()
-                    idx = int(parts[0])
-                    domain = int(parts[1])
-                    mapping[idx] = domain
+        # Header (vertex count), then (vertex, domain) pairs in any order
+        pairs = tokens[1:].reshape(-1, 2)
+        mapping = np.zeros(int(tokens[0]), dtype=np.int64)
+        mapping[pairs[:, 0]] = pairs[:, 1]
 
         return Mapping(mapping)
 
+    @internal_api
+    def save_binary(self, filename: Union[str, Path]) -> None:
+        """
+        Save the mapping as a NumPy ``.npy`` array, for fast reloading.
+
+        Unlike save(), the file holds only the domain array (vertex i maps to
+        element i), with no text conversion either way. Scotch's own tools
+        cannot read it.
+
+        Args:
+            filename: Output file path (used as given; no suffix is added)
+        """
+        with open(filename, "wb", buffering=_IO_BUFFER_SIZE) as f:
+            np.save(f, self.mapping, allow_pickle=False)
+
+    @staticmethod
+    @internal_api
+    def load_binary(filename: Union[str, Path]) -> "Mapping":
+        """
+        Load a mapping written by save_binary().
+
+        The array is memory-mapped read-only rather than read into a private
+        buffer, so no text is parsed and nothing is copied. Validation still
+        scans it once at load (min and max), which faults every page in from
+        the page cache; loading is therefore linear in the mapping size.
+
+        Args:
+            filename: Path to the ``.npy`` mapping file
+
+        Returns:
+            New Mapping instance
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file does not hold a 1-D integer array
+        """
+        filename = Path(filename)
+        if not filename.exists():
+            raise FileNotFoundError(f"Mapping file not found: {filename}")
+
+        mapping = np.load(filename, mmap_mode="r", allow_pickle=False)
+        if mapping.ndim != 1 or mapping.dtype.kind not in "iu" or len(mapping) == 0:
+            raise ValueError(f"{filename}: not a non-empty 1-D integer mapping array")
+
+        # The read-only map is already immutable: adopt it instead of letting
+        # __init__ copy it. Other integer dtypes are converted (and frozen).
+        mapping = np.asarray(mapping, dtype=np.int64)
+        if mapping.flags.writeable:
+            mapping.setflags(write=False)
+        result = Mapping.__new__(Mapping)
+        result._adopt(mapping)
+        return result
+
     @internal_api
     def get_partition_sizes(self) -> np.ndarray:
         """
@@ -92,8 +163,31 @@ class Mapping:
         Returns:
             Array of partition sizes
         """
-        num_parts = int(np.max(self.mapping)) + 1
-        return np.bincount(self.mapping.astype(np.intp), minlength=num_parts).astype(np.int64)
+        return self._partition_sizes().copy()
+
+    def _partition_sizes(self) -> np.ndarray:
+        """Memoized partition sizes, shared by get_partition_sizes and balance."""
+        if self._sizes is None:
+            # copy=False: on 64-bit platforms both casts are no-ops (intp is int64)
+            counts = np.bincount(
+                self.mapping.astype(np.intp, copy=False), minlength=self._max_domain + 1
+            )
+            self._sizes = counts.astype(np.int64, copy=False)
+        return self._sizes
+
+    def _build_index(self) -> None:
+        """Group vertex indices by domain (CSR layout) for get_partition.
+
+        ``_order[_offsets[d]:_offsets[d + 1]]`` lists the vertices of domain
+        ``d`` in increasing order; the stable sort keeps them that way.
+        """
+        order = np.argsort(self.mapping, kind="stable")
+        offsets = np.zeros(self._max_domain + 2, dtype=np.intp)
+        np.cumsum(self._partition_sizes(), out=offsets[1:])
+        # get_partition hands out views: keep them from writing into the index
+        order.setflags(write=False)
+        self._order = order
+        self._offsets = offsets
 
     @internal_api
     def get_partition(self, domain: int) -> np.ndarray:
@@ -104,7 +198,7 @@ class Mapping:
             domain: Domain index
 
         Returns:
-            Array of vertex indices in the domain
+            Array of vertex indices in the domain (a read-only view)
 
         Raises:
             ValueError: If domain is invalid
@@ -112,11 +206,27 @@ class Mapping:
         if domain < 0:
             raise ValueError(f"domain must be non-negative, got {domain}")
 
-        max_domain = int(np.max(self.mapping))
-        if domain > max_domain:
-            raise ValueError(f"domain {domain} exceeds maximum domain {max_domain}")
+        if domain > self._max_domain:
+            raise ValueError(f"domain {domain} exceeds maximum domain {self._max_domain}")
 
-        return np.where(self.mapping == domain)[0]
+        if self._order is None:
+            self._build_index()
+        return self._order[self._offsets[domain] : self._offsets[domain + 1]]
+
+    @internal_api
+    def all_partitions(self) -> List[np.ndarray]:
+        """
+        Get the vertices of every domain at once.
+
+        Equivalent to ``[get_partition(d) for d in range(num_partitions())]``,
+        from the same index built by a single argsort.
+
+        Returns:
+            List of read-only views, one array of vertex indices per domain
+        """
+        if self._order is None:
+            self._build_index()
+        return np.split(self._order, self._offsets[1:-1])
 
     @internal_api
     def num_partitions(self) -> int:
@@ -126,7 +236,7 @@ class Mapping:
         Returns:
             Number of distinct partitions
         """
-        return int(np.max(self.mapping)) + 1
+        return self._max_domain + 1
 
     @internal_api
     def balance(self) -> float:
@@ -136,18 +246,28 @@ class Mapping:
         Returns:
             Balance ratio (max_size / avg_size)
         """
-        sizes = self.get_partition_sizes()
-        avg_size = np.mean(sizes)
-        max_size = np.max(sizes)
-        return float(max_size / avg_size) if avg_size > 0 else 0.0
+        # The average size is size / num_parts by construction; only the
+        # largest partition needs a pass over the (memoized) sizes
+        max_size = int(self._partition_sizes().max())
+        return max_size * (self._max_domain + 1) / self.size
 
     def __len__(self) -> int:
         """Get the size of the mapping."""
         return self.size
 
-    def __getitem__(self, idx: int) -> int:
-        """Get the domain assignment for a vertex."""
-        return int(self.mapping[idx])
+    def __getitem__(self, idx):
+        """Get the domain of a vertex, or an array of domains for a slice or index array.
+
+        Slices return read-only views of the (immutable) mapping; index
+        arrays follow NumPy's fancy-indexing rules and return copies.
+        """
+        value = self.mapping[idx]
+        return int(value) if np.ndim(value) == 0 else value
+
+    def __iter__(self):
+        """Iterate over the domain assignments as Python ints."""
+        # tolist() converts in one C loop instead of one __getitem__ call per vertex
+        return iter(self.mapping.tolist())
 
     def __repr__(self) -> str:
         """String representation of the mapping."""
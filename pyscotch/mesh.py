@@ -3,13 +3,17 @@ Mesh class for PT-Scotch mesh operations.
 """
 
 import numpy as np
-from ctypes import byref, POINTER, c_void_p
+from ctypes import addressof, byref, c_void_p
 from pathlib import Path
 from typing import Union, Optional, Tuple
-from .graph import c_fopen  # Use our FILE* compat layer
+from .graph import c_fopen, _as_scotch_array, _from_buffer  # Use our FILE* compat layer
+from ._textio import _IO_BUFFER_SIZE, _write_int_rows
 from .api_decorators import scotch_binding, highlevel_api, internal_api
 from . import libscotch as lib
 
+# NumPy dtype of SCOTCH_Num; fixed once the Scotch library is loaded
+_SCOTCH_DTYPE = lib.get_scotch_dtype()
+
 
 class Mesh:
     """
@@ -25,7 +29,10 @@ class Mesh:
     def __init__(self):
         """Initialize an empty mesh."""
         self._mesh = lib.SCOTCH_Mesh()
-        ret = lib.SCOTCH_meshInit(byref(self._mesh))
+        # Stable for the life of the instance; passed to lib.raw_function
+        # entry points (regular bindings get self._mesh itself, see Graph)
+        self._mesh_addr = addressof(self._mesh)
+        ret = lib.SCOTCH_meshInit(self._mesh)
         if ret != 0:
             raise lib.scotch_error("Failed to initialize mesh", ret)
 
@@ -42,7 +49,7 @@ class Mesh:
     def close(self):
         """Release mesh resources. Called automatically when used as a context manager."""
         if getattr(self, "_initialized", False):
-            lib.SCOTCH_meshExit(byref(self._mesh))
+            lib.SCOTCH_meshExit(self._mesh)
             self._initialized = False
 
     @scotch_binding("SCOTCH_meshLoad", "int SCOTCH_meshLoad(SCOTCH_Mesh *, FILE *, SCOTCH_Num)")
@@ -60,14 +67,12 @@ class Mesh:
             IOError: If file cannot be opened
             RuntimeError: If loading fails
         """
-        filename = Path(filename)
-        if not filename.exists():
-            raise FileNotFoundError(f"Mesh file not found: {filename}")
-
-        # Use our compat layer - guarantees ABI compatibility with Scotch
-        with c_fopen(str(filename), "r") as file_ptr:
-            baseval = lib.SCOTCH_Num(-1)  # -1 means use baseval from file
-            ret = lib.SCOTCH_meshLoad(byref(self._mesh), file_ptr, baseval)
+        # Use our compat layer - guarantees ABI compatibility with Scotch.
+        # fopen's own ENOENT raises FileNotFoundError, so no stat beforehand.
+        with c_fopen(filename, "r") as file_ptr:
+            # -1: use the file's baseval. A plain int is converted by the
+            # SCOTCH_Num argtype, with no ctypes object built per call
+            ret = lib.SCOTCH_meshLoad(self._mesh, file_ptr, -1)
 
             if ret != 0:
                 raise lib.scotch_error(f"Failed to load mesh from {filename}", ret)
@@ -86,11 +91,9 @@ class Mesh:
             IOError: If file cannot be opened
             RuntimeError: If saving fails
         """
-        filename = Path(filename)
-
         # Use our compat layer - guarantees ABI compatibility with Scotch
-        with c_fopen(str(filename), "w") as file_ptr:
-            ret = lib.SCOTCH_meshSave(byref(self._mesh), file_ptr)
+        with c_fopen(filename, "w") as file_ptr:
+            ret = lib.SCOTCH_meshSave(self._mesh, file_ptr)
 
             if ret != 0:
                 raise lib.scotch_error(f"Failed to save mesh to {filename}", ret)
@@ -113,6 +116,20 @@ class Mesh:
         """
         Build a mesh from arrays.
 
+        Arrays that are already contiguous, writable and of the Scotch integer
+        dtype (``lib.get_scotch_dtype()``) are used in place, as Graph.build()
+        does: modifying them afterwards modifies the mesh. Any other input,
+        including a read-only buffer, is converted into a private copy.
+
+        That includes memory-mapped arrays, so a mesh too large to read into
+        memory can be built straight from its files. Map them copy-on-write,
+        ``np.memmap(path, dtype=lib.get_scotch_dtype(), mode="c")``: Scotch
+        then reads the page cache directly, and any page it writes to gets a
+        private copy instead of changing the file. A ``mode="r"`` map is
+        read-only and therefore copied in full. As in Graph.build(), other
+        buffer-protocol objects (memoryview, mmap, ...) are accepted too;
+        untyped byte buffers are read as native SCOTCH_Num values.
+
         Args:
             velmnbr: Number of elements
             vnodnbr: Number of nodes
@@ -126,41 +143,36 @@ class Mesh:
         Raises:
             RuntimeError: If building fails
         """
-        edgenbr = len(edgetab)
-
-        # Convert to ctypes arrays using the correct dtype for the loaded Scotch variant
-        scotch_dtype = lib.get_scotch_dtype()
-        self._verttab = verttab.astype(scotch_dtype)
-        self._edgetab = edgetab.astype(scotch_dtype)
-        self._velotab = velotab.astype(scotch_dtype) if velotab is not None else None
-        self._vnlotab = vnlotab.astype(scotch_dtype) if vnlotab is not None else None
-
-        verttab_c = self._verttab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-        edgetab_c = self._edgetab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-
-        velotab_c = (
-            self._velotab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-            if self._velotab is not None
-            else None
-        )
-        vnlotab_c = (
-            self._vnlotab.ctypes.data_as(POINTER(lib.SCOTCH_Num))
-            if self._vnlotab is not None
-            else None
+        verttab, edgetab, velotab, vnlotab = (
+            _from_buffer(tab) for tab in (verttab, edgetab, velotab, vnlotab)
         )
+        edgenbr = len(edgetab)
 
-        ret = lib.SCOTCH_meshBuild(
-            byref(self._mesh),
-            lib.SCOTCH_Num(velmbas),
-            lib.SCOTCH_Num(vnodbas),
-            lib.SCOTCH_Num(velmnbr),
-            lib.SCOTCH_Num(vnodnbr),
+        # Scotch dtype, contiguous; copied only when the input is not already
+        scotch_dtype = _SCOTCH_DTYPE
+        self._verttab = _as_scotch_array(verttab, scotch_dtype)
+        self._edgetab = _as_scotch_array(edgetab, scotch_dtype)
+        self._velotab = _as_scotch_array(velotab, scotch_dtype) if velotab is not None else None
+        self._vnlotab = _as_scotch_array(vnlotab, scotch_dtype) if vnlotab is not None else None
+
+        # Raw addresses for lib.raw_function; the arrays are held above
+        verttab_c = self._verttab.ctypes.data
+        edgetab_c = self._edgetab.ctypes.data
+        velotab_c = self._velotab.ctypes.data if self._velotab is not None else None
+        vnlotab_c = self._vnlotab.ctypes.data if self._vnlotab is not None else None
+
+        ret = lib.raw_function("SCOTCH_meshBuild")(
+            self._mesh_addr,
+            int(velmbas),
+            int(vnodbas),
+            int(velmnbr),
+            int(vnodnbr),
             verttab_c,
             None,  # vendtab
             velotab_c,
             vnlotab_c,
             None,  # vlbltab
-            lib.SCOTCH_Num(edgenbr),
+            edgenbr,
             edgetab_c,
         )
 
@@ -175,7 +187,7 @@ class Mesh:
         Returns:
             True if the mesh is valid, False otherwise
         """
-        ret = lib.SCOTCH_meshCheck(byref(self._mesh))
+        ret = lib.SCOTCH_meshCheck(self._mesh)
         return ret == 0
 
     @scotch_binding("SCOTCH_meshGraph", "int SCOTCH_meshGraph(const SCOTCH_Mesh *, SCOTCH_Graph *)")
@@ -192,7 +204,7 @@ class Mesh:
         from .graph import Graph
 
         graph = Graph()
-        ret = lib.SCOTCH_meshGraph(byref(self._mesh), byref(graph._graph))
+        ret = lib.raw_function("SCOTCH_meshGraph")(self._mesh_addr, graph._graph_addr)
 
         if ret != 0:
             raise lib.scotch_error("Failed to convert mesh to graph", ret)
@@ -219,9 +231,7 @@ class Mesh:
         from .graph import Graph
 
         graph = Graph()
-        ret = lib.SCOTCH_meshGraphDual(
-            byref(self._mesh), byref(graph._graph), lib.SCOTCH_Num(ncomm)
-        )
+        ret = lib.SCOTCH_meshGraphDual(self._mesh, graph._graph, int(ncomm))
 
         if ret != 0:
             raise lib.scotch_error("Failed to convert mesh to dual graph", ret)
@@ -251,10 +261,10 @@ class Mesh:
         size = lib.SCOTCH_Num()
         velmnbr = lib.SCOTCH_Num()
         vnodnbr = lib.SCOTCH_Num()
-        lib.SCOTCH_meshSize(byref(self._mesh), byref(velmnbr), byref(vnodnbr), byref(size))
+        lib.SCOTCH_meshSize(self._mesh, byref(velmnbr), byref(vnodnbr), byref(size))
         vertnbr = vnodnbr.value
 
-        scotch_dtype = lib.get_scotch_dtype()
+        scotch_dtype = _SCOTCH_DTYPE
         permtab = np.zeros(vertnbr, dtype=scotch_dtype)
         peritab = np.zeros(vertnbr, dtype=scotch_dtype)
         cblkptr = lib.SCOTCH_Num()
@@ -262,12 +272,12 @@ class Mesh:
         if strategy is None:
             strategy = Strategy()
 
-        ret = lib.SCOTCH_meshOrder(
-            byref(self._mesh),
-            byref(strategy._strat),
-            permtab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
-            peritab.ctypes.data_as(POINTER(lib.SCOTCH_Num)),
-            byref(cblkptr),
+        ret = lib.raw_function("SCOTCH_meshOrder")(
+            self._mesh_addr,
+            addressof(strategy._strat),
+            permtab.ctypes.data,
+            peritab.ctypes.data,
+            addressof(cblkptr),
             None,
             None,
         )
@@ -319,7 +329,7 @@ class Mesh:
             mapping: Partition array to save
         """
         filename = Path(filename)
-        with open(filename, "w") as f:
+        mapping = np.asarray(mapping)
+        with open(filename, "w", buffering=_IO_BUFFER_SIZE) as f:
             f.write(f"{len(mapping)}\n")
-            for i, part in enumerate(mapping):
-                f.write(f"{i}\t{part}\n")
+            _write_int_rows(f, (np.arange(len(mapping)), mapping))
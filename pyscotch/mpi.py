@@ -7,8 +7,8 @@ distributed graph operations.
 
 import ctypes
 import ctypes.util
+import warnings
 from typing import Optional
-import sys
 
 
 class MPI:
@@ -18,6 +18,10 @@ class MPI:
         self._libmpi: Optional[ctypes.CDLL] = None
         self._initialized = False
         self._comm_world = None
+        # Rank and size in MPI_COMM_WORLD are fixed once MPI is initialized,
+        # so each is queried through the FFI once and then served from here
+        self._world_rank: Optional[int] = None
+        self._world_size: Optional[int] = None
 
     def _load(self):
         """Load MPI library."""
@@ -118,7 +122,7 @@ class MPI:
         if ret == 0:
             self._initialized = True
         else:
-            print(f"Warning: MPI_Init returned {ret}", file=sys.stderr)
+            warnings.warn(f"MPI_Init returned {ret}", RuntimeWarning, stacklevel=2)
 
         return ret
 
@@ -149,11 +153,30 @@ class MPI:
         """Get MPI_COMM_WORLD as c_void_p for passing to Scotch.
 
         Returns:
-            MPI_COMM_WORLD communicator
+            MPI_COMM_WORLD communicator (a new object on each call, so callers
+            may keep or modify it freely)
         """
         self._load()
         return ctypes.c_void_p(self._comm_world)
 
+    def _default_comm(self, comm):
+        """comm, or MPI_COMM_WORLD's address when comm is None.
+
+        The MPI_* bindings declare c_void_p arguments, so the plain address
+        needs no c_void_p object per call.
+        """
+        if comm is None:
+            self._load()
+            return self._comm_world
+        return comm
+
+    def _is_comm_world(self, comm) -> bool:
+        """Whether comm designates MPI_COMM_WORLD (None, or its c_void_p/address)."""
+        if comm is None:
+            return True
+        value = comm.value if isinstance(comm, ctypes.c_void_p) else comm
+        return value is not None and value == self._comm_world
+
     def comm_size(self, comm=None) -> int:
         """Get communicator size.
 
@@ -163,12 +186,16 @@ class MPI:
         Returns:
             Number of processes in the communicator
         """
-        if comm is None:
-            comm = self.get_comm_world()
+        world = self._is_comm_world(comm)
+        if world and self._world_size is not None:
+            return self._world_size
+        comm = self._default_comm(comm)
         size = ctypes.c_int()
         ret = self._libmpi.MPI_Comm_size(comm, ctypes.byref(size))
         if ret != 0:
             raise RuntimeError(f"MPI_Comm_size failed with error {ret}")
+        if world:
+            self._world_size = size.value
         return size.value
 
     def comm_rank(self, comm=None) -> int:
@@ -180,12 +207,16 @@ class MPI:
         Returns:
             Process rank (0 to size-1)
         """
-        if comm is None:
-            comm = self.get_comm_world()
+        world = self._is_comm_world(comm)
+        if world and self._world_rank is not None:
+            return self._world_rank
+        comm = self._default_comm(comm)
         rank = ctypes.c_int()
         ret = self._libmpi.MPI_Comm_rank(comm, ctypes.byref(rank))
         if ret != 0:
             raise RuntimeError(f"MPI_Comm_rank failed with error {ret}")
+        if world:
+            self._world_rank = rank.value
         return rank.value
 
     def barrier(self, comm=None) -> int:
@@ -203,8 +234,7 @@ class MPI:
         Returns:
             0 on success, error code otherwise
         """
-        if comm is None:
-            comm = self.get_comm_world()
+        comm = self._default_comm(comm)
         ret = self._libmpi.MPI_Barrier(comm)
         if ret != 0:
             raise RuntimeError(f"MPI_Barrier failed with error {ret}")
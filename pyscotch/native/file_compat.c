@@ -4,7 +4,7 @@
  * Provides FILE* operations compiled with the SAME toolchain/libc as Scotch,
  * guaranteeing ABI compatibility (no struct layout mismatches, LFS issues, etc.)
  *
- * V0: Minimal wrappers - just fopen/fclose
+ * V0: Minimal wrappers - just fopen/fclose (plus setvbuf for large buffers)
  *
  * Usage from Python (via ctypes):
  *   compat = ctypes.CDLL("libpyscotch_compat.so")
@@ -40,6 +40,23 @@ int pyscotch_fclose(FILE* stream) {
     return fclose(stream);
 }
 
+/*
+ * Give a freshly opened stream a fully buffered, size-byte buffer
+ *
+ * Must be called before any I/O on the stream. glibc's default buffer is
+ * one filesystem block (typically 4 KiB), far too small for multi-MB graph
+ * files read and written with fscanf/fprintf.
+ *
+ * Returns: 0 on success, nonzero on failure (the stream stays usable with
+ * its default buffering)
+ */
+int pyscotch_setvbuf(FILE* stream, size_t size) {
+    if (stream == NULL) {
+        return EOF;
+    }
+    return setvbuf(stream, NULL, _IOFBF, size);
+}
+
 /*
  * Get current errno value
  *
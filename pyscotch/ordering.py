@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Union, Tuple, Optional
 
 from .api_decorators import internal_api
+from ._textio import _IO_BUFFER_SIZE, _read_int_tokens, _write_int_rows
 
 
 class Ordering:
@@ -42,10 +43,9 @@ class Ordering:
                     f"must match permutation size ({self.size})"
                 )
         else:
-            # Compute inverse if not provided
+            # Compute inverse if not provided: invp[perm[i]] = i, as one scatter
             self.inverse_permutation = np.zeros(self.size, dtype=np.int64)
-            for i, p in enumerate(self.permutation):
-                self.inverse_permutation[p] = i
+            self.inverse_permutation[self.permutation] = np.arange(self.size, dtype=np.int64)
 
     @internal_api
     def save(self, filename: Union[str, Path]) -> None:
@@ -56,10 +56,9 @@ class Ordering:
             filename: Output file path
         """
         filename = Path(filename)
-        with open(filename, "w") as f:
+        with open(filename, "w", buffering=_IO_BUFFER_SIZE) as f:
             f.write(f"{self.size}\n")
-            for i in range(self.size):
-                f.write(f"{i}\t{self.permutation[i]}\t{self.inverse_permutation[i]}\n")
+            _write_int_rows(f, (np.arange(self.size), self.permutation, self.inverse_permutation))
 
     @staticmethod
     @internal_api
@@ -75,25 +74,23 @@ class Ordering:
 
         Raises:
             FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a well-formed ordering file
         """
         filename = Path(filename)
         if not filename.exists():
             raise FileNotFoundError(f"Ordering file not found: {filename}")
 
-        with open(filename, "r") as f:
-            lines = f.readlines()
-            size = int(lines[0].strip())
-            permutation = np.zeros(size, dtype=np.int64)
-            inverse_permutation = np.zeros(size, dtype=np.int64)
-
-            for line in lines[1:]:
-                if line.strip():
-                    parts = line.strip().split()
-                    idx = int(parts[0])
-                    perm_val = int(parts[1])
-                    inv_val = int(parts[2])
-                    permutation[idx] = perm_val
-                    inverse_permutation[idx] = inv_val
+        tokens = _read_int_tokens(filename)
+        if len(tokens) == 0 or len(tokens) % 3 != 1:
+            raise ValueError(f"{filename}: malformed ordering file")
+
+        # Header (vertex count), then (index, permutation, inverse) triples
+        rows = tokens[1:].reshape(-1, 3)
+        size = int(tokens[0])
+        permutation = np.zeros(size, dtype=np.int64)
+        inverse_permutation = np.zeros(size, dtype=np.int64)
+        permutation[rows[:, 0]] = rows[:, 1]
+        inverse_permutation[rows[:, 0]] = rows[:, 2]
 
         return Ordering(permutation, inverse_permutation)
 
@@ -907,6 +907,8 @@ class BuiltStrategy:
     into an error.
     """
 
+    __slots__ = ("_strat_data", "_family", "_nparts", "_active")
+
     def __init__(self, strat_data, family: str, nparts: Optional[int]):
         self._strat_data = strat_data
         self._family = family
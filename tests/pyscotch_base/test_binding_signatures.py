@@ -165,3 +165,21 @@ def test_binding_signatures_match_headers():
             elif argtype not in accept:
                 errors.append(f"{name} arg {i}: argtype {argtype} != header '{param.strip()}'")
     assert errors == [], "\n" + "\n".join(errors)
+
+
+def test_raw_signatures_match_declared_bindings():
+    """Raw bindings must keep the declared arity, restype and scalar argtypes."""
+    errors = []
+    for name, (restype, argtypes) in sorted(lib._RAW_SIGNATURES.items()):
+        decl_restype, decl_argtypes = lib._DECLARED_BINDINGS[name]
+        if restype is not decl_restype:
+            errors.append(f"{name}: raw restype {restype} != declared {decl_restype}")
+        if len(argtypes) != len(decl_argtypes):
+            errors.append(f"{name}: {len(argtypes)} raw argtypes, {len(decl_argtypes)} declared")
+            continue
+        for i, (raw, decl) in enumerate(zip(argtypes, decl_argtypes)):
+            # Pointer parameters become c_void_p; everything else is unchanged
+            is_pointer = decl is c_void_p or issubclass(decl, ctypes._Pointer)
+            if (raw is c_void_p) != is_pointer or (not is_pointer and raw is not decl):
+                errors.append(f"{name} arg {i}: raw {raw} vs declared {decl}")
+    assert errors == [], "\n" + "\n".join(errors)
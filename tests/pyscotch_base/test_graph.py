@@ -2,10 +2,13 @@
 Unit tests for Graph class.
 """
 
+import array
+
 import pytest
 import numpy as np
 from pathlib import Path
 from pyscotch import Graph, Strategy, Mapping
+from pyscotch import libscotch as lib
 
 
 class TestGraph:
@@ -26,6 +29,30 @@ class TestGraph:
         assert vertnbr == 3
         assert edgenbr > 0
 
+    def test_graph_from_edges_array(self):
+        """Test that an (E, 2) array gives the same graph as a list of tuples."""
+        edges = [(0, 1), (1, 2), (2, 3), (3, 0)]
+        from_list = Graph.from_edges(edges, num_vertices=4)
+        from_array = Graph.from_edges(np.array(edges, dtype=np.int64), num_vertices=4)
+        assert from_array.size() == from_list.size()
+        assert from_array.check() is True
+
+    def test_graph_from_edges_bad_shape(self):
+        """Test that edges not given as pairs are rejected."""
+        with pytest.raises(ValueError, match="pairs"):
+            Graph.from_edges(np.arange(6), num_vertices=6)
+
+    def test_graph_from_edges_weighted(self):
+        """Test that edge weights are mirrored onto both arcs of each edge."""
+        edges = [(0, 1), (1, 2), (2, 0)]
+        graph = Graph.from_edges(edges, num_vertices=3, edge_weights=[2, 3, 4])
+        assert graph.check() is True
+
+        stats = graph.stat()
+        assert stats["edlomin"] == 2
+        assert stats["edlomax"] == 4
+        assert stats["edlosum"] == 2 + 3 + 4
+
     def test_graph_build(self):
         """Test building a graph from arrays."""
         # Simple triangle graph
@@ -39,6 +66,149 @@ class TestGraph:
         assert vertnbr == 3
         assert edgenbr == 6
 
+    def test_graph_arrays_cache_line_aligned(self):
+        """Converted CSR arrays start on 64-byte boundaries."""
+        verttab = [0, 2, 4, 6]
+        edgetab = [1, 2, 0, 2, 0, 1]
+        built = Graph()
+        built.build(np.array(verttab, dtype=np.int16), np.array(edgetab, dtype=np.int16))
+        from_edges = Graph.from_edges([(0, 1), (1, 2), (2, 0)])
+        for graph in (built, from_edges):
+            assert graph._verttab.ctypes.data % 64 == 0
+            assert graph._edgetab.ctypes.data % 64 == 0
+            assert graph.check()
+
+    def test_graph_build_uses_matching_arrays_in_place(self):
+        """Arrays already in the Scotch dtype are not copied by build()."""
+        scotch_dtype = lib.get_scotch_dtype()
+        verttab = np.array([0, 2, 4, 6], dtype=scotch_dtype)
+        edgetab = np.array([1, 2, 0, 2, 0, 1], dtype=scotch_dtype)
+        graph = Graph()
+        graph.build(verttab, edgetab)
+        assert graph._verttab is verttab
+        assert graph._edgetab is edgetab
+        assert graph.check()
+
+    def test_graph_in_place_arrays_alias_the_graph(self):
+        """Changes to arrays used in place show up in the graph, and vice versa."""
+        dtype = lib.get_scotch_dtype()
+        verttab = np.array([0, 2, 4, 6], dtype=dtype)
+        edgetab = np.array([1, 2, 0, 2, 0, 1], dtype=dtype)
+        velotab = np.array([1, 1, 1], dtype=dtype)
+        graph = Graph()
+        graph.build(verttab, edgetab, velotab=velotab)
+        velotab[2] = 5
+        assert graph.stat()["velomax"] == 5
+
+        # base() rewrites the caller's arrays
+        assert graph.base(1) == 0
+        assert verttab.tolist() == [1, 3, 5, 7]
+        assert edgetab.tolist() == [2, 3, 1, 3, 1, 2]
+        assert graph.check()
+
+    def test_graph_size_follows_rebuild(self):
+        """The cached size() is refreshed when the graph is rebuilt."""
+        graph = Graph()
+        graph.build(np.array([0, 2, 4, 6]), np.array([1, 2, 0, 2, 0, 1]))
+        assert graph.size() == (3, 6)
+        assert graph.check()
+        graph.build(np.array([0, 2, 4, 6, 8]), np.array([1, 3, 0, 2, 1, 3, 2, 0]))
+        assert graph.size() == (4, 8)
+        assert graph.check()
+
+    def test_graph_free_keeps_structure_usable(self):
+        """free() empties the graph; it can then be built again."""
+        graph = Graph.from_edges([(0, 1), (1, 2), (2, 0)])
+        graph.free()
+        assert graph.size() == (0, 0)
+        graph.build(np.array([0, 1, 2]), np.array([1, 0]))
+        assert graph.size() == (2, 2)
+        assert graph.check()
+
+    def test_graph_build_from_buffers(self):
+        """Buffer-protocol inputs are viewed, not converted through lists."""
+        dtype = lib.get_scotch_dtype()
+        verttab = np.array([0, 2, 4, 6], dtype=dtype)
+        edgetab = np.array([1, 2, 0, 2, 0, 1], dtype=dtype)
+        graph = Graph()
+        graph.build(memoryview(verttab), edgetab.tobytes())
+        assert graph.size() == (3, 6)
+        assert graph.check()
+        assert np.shares_memory(graph._verttab, verttab)
+
+    def test_graph_check_sees_changes_to_aliased_arrays(self):
+        """check() is re-run each time, so it notices edits to in-place arrays."""
+        dtype = lib.get_scotch_dtype()
+        verttab = np.array([0, 2, 4, 6], dtype=dtype)
+        edgetab = np.array([1, 2, 0, 2, 0, 1], dtype=dtype)
+        graph = Graph()
+        graph.build(verttab, edgetab)
+        assert graph.check()
+        edgetab[0] = 2  # vertex 0 now lists neighbour 2 twice; 1 -> 0 is unmatched
+        assert not graph.check()
+
+    def test_graph_build_from_one_byte_typed_buffers(self):
+        """1-byte typed buffers are converted by value, not read as raw bytes."""
+        verttab = array.array("b", [0, 2, 4, 6])
+        edgetab = memoryview(np.array([1, 2, 0, 2, 0, 1], dtype=np.uint8))
+        graph = Graph()
+        graph.build(verttab, edgetab)
+        assert graph.size() == (3, 6)
+        assert graph._verttab.tolist() == [0, 2, 4, 6]
+        assert graph.check()
+
+    def test_graph_build_from_cast_byte_view(self):
+        """A view explicitly cast to bytes is read as raw SCOTCH_Num values."""
+        dtype = lib.get_scotch_dtype()
+        verttab = np.array([0, 2, 4, 6], dtype=dtype)
+        edgetab = np.array([1, 2, 0, 2, 0, 1], dtype=dtype)
+        graph = Graph()
+        graph.build(memoryview(verttab).cast("B"), edgetab)
+        assert graph.size() == (3, 6)
+        assert np.shares_memory(graph._verttab, verttab)
+
+    def test_graph_base_copies_read_only_inputs(self):
+        """base() rebases a private copy of read-only (bytes) inputs."""
+        dtype = lib.get_scotch_dtype()
+        verttab = np.array([0, 2, 4, 6], dtype=dtype).tobytes()
+        edgetab = np.array([1, 2, 0, 2, 0, 1], dtype=dtype).tobytes()
+        graph = Graph()
+        graph.build(verttab, edgetab)
+        assert graph.base(1) == 0
+        assert graph.check()
+        assert np.frombuffer(verttab, dtype=dtype).tolist() == [0, 2, 4, 6]
+        assert np.frombuffer(edgetab, dtype=dtype).tolist() == [1, 2, 0, 2, 0, 1]
+
+    def test_graph_build_non_compact_with_labels(self):
+        """vendtab and vlbltab are handed to SCOTCH_graphBuild in place."""
+        dtype = lib.get_scotch_dtype()
+        # Triangle with an unused edgetab slot after each vertex's arcs
+        verttab = np.array([0, 3, 6], dtype=dtype)
+        vendtab = np.array([2, 5, 8], dtype=dtype)
+        edgetab = np.array([1, 2, -1, 0, 2, -1, 0, 1, -1], dtype=dtype)
+        vlbltab = np.array([10, 20, 30], dtype=dtype)
+        graph = Graph()
+        graph.build(verttab, edgetab, vendtab=vendtab, vlbltab=vlbltab)
+        assert graph.size() == (3, 6)
+        assert graph.check()
+        assert graph._vendtab is vendtab
+        assert graph._vlbltab is vlbltab
+
+    def test_graph_build_rejects_mismatched_vendtab(self):
+        """vendtab must have one entry per verttab entry."""
+        dtype = lib.get_scotch_dtype()
+        verttab = np.array([0, 2, 4], dtype=dtype)
+        edgetab = np.array([1, 2, 0, 2, 0, 1], dtype=dtype)
+        with pytest.raises(ValueError, match="vendtab length"):
+            Graph().build(verttab, edgetab, vendtab=np.array([2, 4], dtype=dtype))
+
+    def test_graph_close_is_idempotent(self):
+        """close() may be called repeatedly, also after a with-block."""
+        with Graph() as graph:
+            pass
+        graph.close()
+        assert not graph._initialized
+
     def test_graph_check(self):
         """Test graph consistency checking."""
         edges = [(0, 1), (1, 2), (2, 0)]
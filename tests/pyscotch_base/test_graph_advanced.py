@@ -4,8 +4,10 @@ stat, base, ordering I/O, mapping I/O, tab I/O.
 """
 
 import numpy as np
+import pytest
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from pyscotch import Graph, Architecture
 from pyscotch import libscotch as lib
@@ -42,6 +44,258 @@ class TestRepart:
         assert result.max() < 2
 
 
+class TestConcurrentCalls:
+    """Scotch calls release the GIL (CDLL bindings): distinct graphs can be
+    partitioned and ordered from several threads at once."""
+
+    def _ring(self, n):
+        return Graph.from_edges([(i, (i + 1) % n) for i in range(n)], num_vertices=n)
+
+    def test_partition_from_thread_pool(self):
+        graphs = [self._ring(n) for n in range(20, 28)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda g: g.partition(2), graphs))
+        for g, parts in zip(graphs, results):
+            assert len(parts) == g.size()[0]
+            assert set(parts.tolist()) == {0, 1}
+
+    def test_order_from_thread_pool(self):
+        graphs = [self._ring(n) for n in range(20, 28)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda g: g.order(), graphs))
+        for g, (permtab, peritab) in zip(graphs, results):
+            n = g.size()[0]
+            assert sorted(permtab.tolist()) == list(range(n))
+            assert np.array_equal(permtab[peritab], np.arange(n))
+
+
+class TestBinaryIO:
+    def _weighted(self):
+        graph = Graph()
+        graph.build(
+            np.array([0, 2, 4, 6, 8]),
+            np.array([1, 3, 0, 2, 1, 3, 2, 0]),
+            velotab=np.array([5, 6, 7, 8]),
+            edlotab=np.array([7, 3, 7, 1, 1, 9, 9, 3]),
+        )
+        return graph
+
+    @pytest.mark.parametrize("memory_map", [False, True])
+    def test_roundtrip(self, tmp_path, memory_map):
+        graph = self._weighted()
+        path = tmp_path / "g.bgrf"
+        graph.save_binary(path)
+        loaded = Graph.load_binary(path, memory_map=memory_map)
+        assert loaded.check()
+        assert loaded.size() == graph.size()
+        for a, b in zip(loaded._csr_arrays(), graph._csr_arrays()):
+            assert np.array_equal(a, b)
+        assert loaded.stat() == graph.stat()
+
+    def test_unweighted_roundtrip(self, tmp_path, hexagon_graph):
+        path = tmp_path / "hexagon.bgrf"
+        hexagon_graph.save_binary(path)
+        loaded = Graph.load_binary(path)
+        assert loaded.size() == hexagon_graph.size()
+        assert loaded._csr_arrays()[2] is None
+
+    @pytest.mark.parametrize("memory_map", [False, True])
+    def test_half_edges_roundtrip(self, tmp_path, memory_map):
+        graph = self._weighted()
+        full, half = tmp_path / "full.bgrf", tmp_path / "half.bgrf"
+        graph.save_binary(full)
+        graph.save_binary(half, half_edges=True)
+        assert half.stat().st_size < full.stat().st_size
+        loaded = Graph.load_binary(half, memory_map=memory_map)
+        assert loaded.check()
+        assert loaded.size() == graph.size()
+        assert loaded.stat() == graph.stat()
+        (indptr, indices, edlotab), (ref_indptr, ref_indices, ref_edlotab) = (
+            loaded._csr_arrays(),
+            graph._csr_arrays(),
+        )
+        assert np.array_equal(indptr, ref_indptr)
+        for v in range(4):
+            arcs = slice(indptr[v], indptr[v + 1])
+            got = sorted(zip(indices[arcs], edlotab[arcs]))
+            ref = sorted(zip(ref_indices[arcs], ref_edlotab[arcs]))
+            assert got == ref
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "ring.grf"
+        path.write_text(RING_GRF)
+        with pytest.raises(ValueError, match="not a pyscotch binary graph"):
+            Graph.load_binary(path)
+
+
+class TestPartitionBatch:
+    def _ring(self, n):
+        return Graph.from_edges([(i, (i + 1) % n) for i in range(n)], num_vertices=n)
+
+    def test_one_result_per_graph(self):
+        graphs = [self._ring(n) for n in range(8, 16)]
+        results = Graph.partition_batch(graphs, 4)
+        assert len(results) == len(graphs)
+        for g, parts in zip(graphs, results):
+            assert len(parts) == g.size()[0]
+            assert set(parts.tolist()) == {0, 1, 2, 3}
+
+    def test_threads_match_sequential(self):
+        graphs = [self._ring(n) for n in range(8, 16)]
+        results = Graph.partition_batch(graphs, 4, threads=4)
+        assert len(results) == len(graphs)
+        for g, parts in zip(graphs, results):
+            assert len(parts) == g.size()[0]
+            assert set(parts.tolist()) == {0, 1, 2, 3}
+
+    def test_threads_must_be_positive(self):
+        with pytest.raises(ValueError, match="threads"):
+            Graph.partition_batch([self._ring(8)], 2, threads=0)
+
+    def test_nparts_checked_for_every_graph(self):
+        with pytest.raises(ValueError):
+            Graph.partition_batch([self._ring(8), self._ring(3)], 4)
+
+
+class TestScratchOutputs:
+    def test_partition_copy_false_reuses_buffer(self, grid_4x4_graph):
+        first = grid_4x4_graph.partition(2, copy=False)
+        kept = first.copy()
+        second = grid_4x4_graph.partition(4, copy=False)
+        assert np.shares_memory(first, second)
+        assert second.max() < 4
+        assert kept.max() < 2
+
+    def test_partition_copy_true_is_independent(self, grid_4x4_graph):
+        first = grid_4x4_graph.partition(2)
+        second = grid_4x4_graph.partition(2)
+        assert not np.shares_memory(first, second)
+
+    def test_order_copy_false_reuses_buffers(self, grid_4x4_graph):
+        permtab, peritab = grid_4x4_graph.order(copy=False)
+        permtab2, peritab2 = grid_4x4_graph.order(copy=False)
+        assert np.shares_memory(permtab, permtab2)
+        assert np.shares_memory(peritab, peritab2)
+        assert np.array_equal(permtab2[peritab2], np.arange(16))
+
+    def test_partition_out_is_filled_and_returned(self, grid_4x4_graph):
+        out = np.full(16, -1, dtype=lib.get_scotch_dtype())
+        result = grid_4x4_graph.partition(2, out=out)
+        assert result is out
+        assert out.min() >= 0 and out.max() < 2
+
+    def test_order_and_color_out(self, grid_4x4_graph):
+        dtype = lib.get_scotch_dtype()
+        permtab, peritab = np.empty(16, dtype=dtype), np.empty(16, dtype=dtype)
+        result = grid_4x4_graph.order(permtab_out=permtab, peritab_out=peritab)
+        assert result[0] is permtab and result[1] is peritab
+        assert np.array_equal(permtab[peritab], np.arange(16))
+        colotab = np.empty(16, dtype=dtype)
+        assert grid_4x4_graph.color(out=colotab)[0] is colotab
+
+    def test_partition_out_rejects_bad_arrays(self, grid_4x4_graph):
+        with pytest.raises(ValueError):
+            grid_4x4_graph.partition(2, out=np.zeros(15, dtype=lib.get_scotch_dtype()))
+        with pytest.raises(ValueError):
+            grid_4x4_graph.partition(2, out=np.zeros(16, dtype=np.float64))
+
+
+class TestInduceParts:
+    def test_matches_induce_part(self, grid_4x4_graph):
+        partition = np.repeat(np.arange(4), 4)
+        parts = grid_4x4_graph.induce_parts(partition)
+        assert sorted(parts) == [0, 1, 2, 3]
+        for part_id, sub in parts.items():
+            assert sub.check()
+            assert sub.size() == grid_4x4_graph.induce_part(partition, part_id).size()
+
+    def test_empty_parts_are_skipped(self, grid_4x4_graph):
+        partition = np.where(np.arange(16) < 8, 0, 2)
+        assert sorted(grid_4x4_graph.induce_parts(partition)) == [0, 2]
+
+    def test_rejects_out_of_range_parts(self, grid_4x4_graph):
+        with pytest.raises(ValueError):
+            grid_4x4_graph.induce_parts(np.full(16, 256))
+
+
+RING_GRF = "0\n6\t12\n1\t000\n2\t2\t6\n2\t1\t3\n2\t2\t4\n2\t3\t5\n2\t4\t6\n2\t5\t1\n"
+
+# 4-cycle with labels, vertex loads and edge loads (flag 111)
+LABELLED_GRF = """0
+4 8
+0 111
+10 5 2 7 20 3 40
+20 6 2 7 10 1 30
+30 7 2 1 20 9 40
+40 8 2 9 30 3 10
+"""
+
+
+def _raw_arrays(graph):
+    """Scotch's own (based, compact) arrays of a graph, copied out."""
+    base, n, verttab_p, _, velotab_p, edgetab_p, edlotab_p = graph._graph_data()
+    verttab = np.ctypeslib.as_array(verttab_p, shape=(n + 1,)).copy()
+    edgenbr = int(verttab[-1] - base)
+    edgetab = np.ctypeslib.as_array(edgetab_p, shape=(edgenbr,)).copy()
+    velotab = np.ctypeslib.as_array(velotab_p, shape=(n,)).copy() if velotab_p else None
+    edlotab = np.ctypeslib.as_array(edlotab_p, shape=(edgenbr,)).copy() if edlotab_p else None
+    return base, verttab, edgetab, velotab, edlotab
+
+
+class TestLoadAscii:
+    @pytest.mark.parametrize("text", [RING_GRF, LABELLED_GRF])
+    @pytest.mark.parametrize("baseval", [-1, 0, 1])
+    def test_rebasing_matches_scotch_loader(self, tmp_path, text, baseval):
+        """Raw arrays match SCOTCH_graphLoad's for each baseval, on a 1-based file."""
+        path = tmp_path / "graph.grf"
+        path.write_text(text.replace("\n0 111\n", "\n1 111\n"))
+        ref = Graph()
+        ref.load(path, baseval=baseval)
+        graph = Graph.load_ascii(path, baseval=baseval)
+        assert graph.check()
+        ref_arrays = _raw_arrays(ref)
+        arrays = _raw_arrays(graph)
+        assert arrays[0] == ref_arrays[0] == (1 if baseval == -1 else baseval)
+        for a, b in zip(arrays[1:], ref_arrays[1:]):
+            assert (a is None) == (b is None)
+            if a is not None:
+                assert np.array_equal(a, b)
+
+    def test_matches_scotch_loader(self, tmp_path):
+        path = tmp_path / "ring.grf"
+        path.write_text(RING_GRF)
+        ref = Graph()
+        ref.load(path)
+        graph = Graph.load_ascii(path)
+        assert graph.check()
+        assert graph.size() == ref.size() == (6, 12)
+        for a, b in zip(graph._csr_arrays()[:2], ref._csr_arrays()[:2]):
+            assert np.array_equal(a, b)
+
+    def test_keep_file_base(self, tmp_path):
+        path = tmp_path / "ring.grf"
+        path.write_text(RING_GRF)
+        graph = Graph.load_ascii(path, baseval=-1)
+        assert graph.check()
+        assert graph.base(1) == 1
+
+    def test_labels_and_loads(self, tmp_path):
+        path = tmp_path / "labelled.grf"
+        path.write_text(LABELLED_GRF)
+        graph = Graph.load_ascii(path)
+        assert graph.check()
+        indptr, indices, edlotab = graph._csr_arrays()
+        assert indices.tolist() == [1, 3, 0, 2, 1, 3, 2, 0]
+        assert edlotab.tolist() == [7, 3, 7, 1, 1, 9, 9, 3]
+        assert graph.stat()['velosum'] == 5 + 6 + 7 + 8
+
+    def test_truncated_file(self, tmp_path):
+        path = tmp_path / "bad.grf"
+        path.write_text(RING_GRF.rsplit("2", 1)[0])
+        with pytest.raises(ValueError):
+            Graph.load_ascii(path)
+
+
 class TestGraphStat:
     def test_degree_hexagon(self, hexagon_graph):
         s = hexagon_graph.stat()
@@ -41,6 +41,25 @@ class TestMapping:
         assert list(part1) == [1, 3]
         assert list(part2) == [4]
 
+    def test_mapping_get_partition_empty_domain(self):
+        """Test that unused domains below the maximum yield empty partitions."""
+        mapping = Mapping(np.array([3, 0, 3, 0], dtype=np.int64))
+
+        assert list(mapping.get_partition(0)) == [1, 3]
+        assert len(mapping.get_partition(1)) == 0
+        assert len(mapping.get_partition(2)) == 0
+        assert list(mapping.get_partition(3)) == [0, 2]
+        assert not mapping.get_partition(3).flags.writeable
+
+    def test_mapping_all_partitions(self):
+        """Test that all_partitions matches per-domain get_partition."""
+        mapping = Mapping(np.array([2, 0, 2, 0, 1, 4], dtype=np.int64))
+        parts = mapping.all_partitions()
+
+        assert len(parts) == mapping.num_partitions()
+        for domain, part in enumerate(parts):
+            assert list(part) == list(mapping.get_partition(domain))
+
     def test_mapping_balance_perfect(self):
         """Test balance calculation with perfect balance."""
         partitions = np.array([0, 0, 1, 1, 2, 2], dtype=np.int64)
@@ -67,6 +86,36 @@ class TestMapping:
         assert sizes[1] == 2
         assert sizes[2] == 1
 
+    def test_mapping_is_isolated_from_caller_array(self):
+        """Test that mutating the input array cannot stale the cached statistics."""
+        partitions = np.array([0, 0, 1, 1], dtype=np.int64)
+        mapping = Mapping(partitions)
+        partitions[0] = 5
+
+        assert mapping.num_partitions() == 2
+        assert list(mapping.get_partition_sizes()) == [2, 2]
+        assert not mapping.mapping.flags.writeable
+
+    def test_mapping_array_is_read_only(self):
+        """Test that writing to Mapping.mapping raises; edit a copy instead."""
+        mapping = Mapping(np.array([0, 0, 1, 1], dtype=np.int64))
+        with pytest.raises(ValueError, match="read-only"):
+            mapping.mapping[0] = 1
+
+        edited = np.array(mapping.mapping)
+        edited[0] = 1
+        assert list(Mapping(edited).get_partition_sizes()) == [1, 3]
+        assert list(mapping.get_partition_sizes()) == [2, 2]
+
+    def test_mapping_partition_sizes_are_a_copy(self):
+        """Test that callers cannot corrupt the memoized partition sizes."""
+        mapping = Mapping(np.array([0, 0, 1, 2], dtype=np.int64))
+        sizes = mapping.get_partition_sizes()
+        sizes[0] = 100
+
+        assert list(mapping.get_partition_sizes()) == [2, 1, 1]
+        assert abs(mapping.balance() - 1.5) < 0.01
+
     def test_mapping_getitem(self):
         """Test indexing into mapping."""
         partitions = np.array([2, 1, 0, 2, 1], dtype=np.int64)
@@ -78,6 +127,20 @@ class TestMapping:
         assert mapping[3] == 2
         assert mapping[4] == 1
 
+    def test_mapping_slicing_and_iteration(self):
+        """Test slices as views and iteration as Python ints."""
+        mapping = Mapping(np.array([2, 1, 0, 2, 1], dtype=np.int64))
+
+        view = mapping[1:4]
+        assert isinstance(view, np.ndarray)
+        assert list(view) == [1, 0, 2]
+        assert np.shares_memory(view, mapping.mapping)
+        with pytest.raises(ValueError):
+            view[:] = 7
+        assert list(mapping[np.array([4, 0])]) == [1, 2]
+        assert list(mapping) == [2, 1, 0, 2, 1]
+        assert all(type(d) is int for d in mapping)
+
     def test_mapping_save_load(self):
         """Test saving and loading mappings."""
         partitions = np.array([0, 1, 2, 0, 1, 2], dtype=np.int64)
@@ -99,6 +162,32 @@ class TestMapping:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
 
+    def test_mapping_save_load_binary(self, tmp_path):
+        """Test the .npy round trip and that loading does not copy."""
+        mapping = Mapping(np.array([0, 1, 2, 0, 1, 2], dtype=np.int64))
+        path = tmp_path / "mapping.bin"
+        mapping.save_binary(path)
+        assert path.exists()
+
+        loaded = Mapping.load_binary(path)
+        assert np.array_equal(loaded.mapping, mapping.mapping)
+        assert not loaded.mapping.flags.owndata
+        assert loaded.balance() == mapping.balance()
+
+    def test_mapping_load_unordered_and_malformed(self, tmp_path):
+        """Test that load scatters pairs by vertex and rejects odd token counts."""
+        path = tmp_path / "unordered.map"
+        path.write_text("4\n3\t1\n0\t2\n\n1\t0\n2\t1\n")
+        assert list(Mapping.load(path).mapping) == [2, 0, 1, 1]
+
+        path.write_text("4\n3\t1\n0\n")
+        with pytest.raises(ValueError):
+            Mapping.load(path)
+
+        path.write_text("4\n3\t1\n0\tx\n")
+        with pytest.raises(ValueError, match="unordered.map"):
+            Mapping.load(path)
+
     def test_mapping_repr(self):
         """Test string representation."""
         partitions = np.array([0, 0, 1, 1], dtype=np.int64)
@@ -203,6 +292,13 @@ class TestOrdering:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
 
+    def test_ordering_load_malformed(self, tmp_path):
+        """Test that a row with a missing column is rejected."""
+        path = tmp_path / "bad.ord"
+        path.write_text("2\n0\t1\t1\n1\t0\n")
+        with pytest.raises(ValueError):
+            Ordering.load(path)
+
     def test_ordering_repr(self):
         """Test string representation."""
         perm = np.array([1, 0, 2], dtype=np.int64)
@@ -107,3 +107,48 @@ class TestMeshOrder:
         perm, inv = mesh.order()
         assert len(perm) == 4
         _assert_valid_ordering(perm, inv)
+
+
+class TestMeshBuildArrays:
+    def test_scotch_dtype_arrays_used_in_place(self):
+        dtype = lib.get_scotch_dtype()
+        verttab = np.array([0, 3, 6, 7, 9, 11, 12], dtype=dtype)
+        edgetab = np.array([2, 3, 4, 3, 4, 5, 0, 0, 1, 0, 1, 1], dtype=dtype)
+        mesh = Mesh()
+        mesh.build(2, 4, verttab, edgetab, velmbas=0, vnodbas=2)
+        assert mesh._verttab is verttab
+        assert mesh._edgetab is edgetab
+        assert mesh.check()
+
+    def test_other_dtypes_are_copied(self):
+        verttab = np.array([0, 3, 6, 7, 9, 11, 12], dtype=np.int16)
+        edgetab = np.array([2, 3, 4, 3, 4, 5, 0, 0, 1, 0, 1, 1], dtype=np.int16)
+        mesh = Mesh()
+        mesh.build(2, 4, verttab, edgetab, velmbas=0, vnodbas=2)
+        assert mesh._verttab.dtype == lib.get_scotch_dtype()
+        assert not np.shares_memory(mesh._verttab, verttab)
+        assert mesh.check()
+
+    def test_memmap_and_buffer_inputs(self, tmp_path):
+        dtype = lib.get_scotch_dtype()
+        path = tmp_path / "edgetab.bin"
+        np.array([2, 3, 4, 3, 4, 5, 0, 0, 1, 0, 1, 1], dtype=dtype).tofile(path)
+        edgetab = np.memmap(path, dtype=dtype, mode="c")
+        verttab = np.array([0, 3, 6, 7, 9, 11, 12], dtype=dtype).tobytes()
+        mesh = Mesh()
+        mesh.build(2, 4, verttab, edgetab, velmbas=0, vnodbas=2)
+        assert np.shares_memory(mesh._edgetab, edgetab)
+        assert list(mesh._verttab) == [0, 3, 6, 7, 9, 11, 12]
+        assert mesh.check()
+
+    def test_read_only_memmap_is_copied(self, tmp_path):
+        dtype = lib.get_scotch_dtype()
+        path = tmp_path / "edgetab.bin"
+        np.array([2, 3, 4, 3, 4, 5, 0, 0, 1, 0, 1, 1], dtype=dtype).tofile(path)
+        edgetab = np.memmap(path, dtype=dtype, mode="r")
+        verttab = np.array([0, 3, 6, 7, 9, 11, 12], dtype=dtype)
+        mesh = Mesh()
+        mesh.build(2, 4, verttab, edgetab, velmbas=0, vnodbas=2)
+        assert not np.shares_memory(mesh._edgetab, edgetab)
+        assert mesh._edgetab.flags.writeable
+        assert mesh.check()
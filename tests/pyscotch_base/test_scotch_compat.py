@@ -386,6 +386,22 @@ class TestCompatLibrary:
         finally:
             os.unlink(test_file)
 
+    def test_c_fopen_reopens_and_reports_missing_files(self, tmp_path):
+        """c_fopen writes, reopens the same file repeatedly, and maps ENOENT."""
+        from pyscotch.graph import c_fopen
+
+        path = tmp_path / "reopen.txt"
+        with c_fopen(path, "w") as fp:
+            assert fp
+        assert path.exists()
+        for _ in range(3):
+            with c_fopen(path, "r") as fp:
+                assert fp
+
+        with pytest.raises(FileNotFoundError):
+            with c_fopen(tmp_path / "missing.txt", "r"):
+                pass
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -16,7 +16,7 @@ Tests run with ONE Scotch variant, configured via environment variables:
 """
 
 import pytest
-from ctypes import byref, sizeof
+from ctypes import alignment, byref, c_double, sizeof
 import numpy as np
 
 from pyscotch import libscotch as lib
@@ -123,6 +123,25 @@ class TestAllStructureTypesHaveComputedSizes:
             "dynamic sizing may have failed"
         )
 
+    def test_sizes_match_sizeof_exactly(self):
+        """Opaque structures are exactly SCOTCH_*Sizeof() bytes, with no padding."""
+        sizeof_names = {"Mapping": "map", "Ordering": "order"}
+        for struct_name in self._get_structure_names():
+            struct_class = getattr(lib, f"SCOTCH_{struct_name}")
+            if struct_class is None:
+                continue  # Skip structures not available in current variant
+            sizeof_name = sizeof_names.get(struct_name, struct_name.lower())
+            expected = getattr(lib, f"SCOTCH_{sizeof_name}Sizeof")()
+            assert sizeof(struct_class) == expected, struct_name
+
+    def test_structures_are_double_aligned(self):
+        """Opaque structures keep the double alignment scotch.h declares."""
+        for struct_name in self._get_structure_names():
+            struct_class = getattr(lib, f"SCOTCH_{struct_name}")
+            if struct_class is None:
+                continue  # Skip structures not available in current variant
+            assert alignment(struct_class) == alignment(c_double), struct_name
+
 
 class TestStructureCreationAndBasicOperations:
     """Test each structure type can be created and used without segfaults."""